@@ -11,6 +11,7 @@ from ghostbit.audiostego.core.audio_steganography import (
 from ghostbit.audiostego.core.audio_multiformat_coder import (
     AudioMultiFormatCoder,
     AudioMultiFormatCoderException,
+    UnsupportedInputFormatError,
 )
 
 from ghostbit.audiostego.skills import (
@@ -29,6 +30,7 @@ __all__ = [
     "AudioSteganographyException",
     "KeyEnterCanceledException",
     "AudioMultiFormatCoderException",
+    "UnsupportedInputFormatError",
     "AudioSkillLoader",
     "load_audio_skill",
     "list_audio_skills",
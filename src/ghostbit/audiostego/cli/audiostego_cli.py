@@ -128,14 +128,15 @@ class AudioStegoCLI:
                 coder.on_encoded_element = on_progress
 
             logger.info(f"Starting encode operation: {len(secret_files)} files")
-            coder.encode_files_multi_format(
-                carrier_file=input_file,
-                secret_files=secret_files,
-                output_file=output_filepath,
-                password=password,
-                quality_mode=quality_mode,
-                use_legacy_kdf=use_legacy_kdf,
-            )
+            with coder.temp_scope():
+                coder.encode_files_multi_format(
+                    carrier_file=input_file,
+                    secret_files=secret_files,
+                    output_file=output_filepath,
+                    password=password,
+                    quality_mode=quality_mode,
+                    use_legacy_kdf=use_legacy_kdf,
+                )
 
             output_size = os.path.getsize(output_filepath)
             logger.info(
@@ -227,12 +228,13 @@ class AudioStegoCLI:
                 coder.on_decoded_element = on_progress
 
             logger.info("Starting decode operation")
-            coder.decode_files_multi_format(
-                encoded_file=input_file,
-                output_dir=output_filepath,
-                password=password,
-                use_legacy_kdf=use_legacy_kdf,
-            )
+            with coder.temp_scope():
+                coder.decode_files_multi_format(
+                    encoded_file=input_file,
+                    output_dir=output_filepath,
+                    password=password,
+                    use_legacy_kdf=use_legacy_kdf,
+                )
 
             logger.info(f"Decoding completed successfully to {output_filepath}")
             print(f"\n{C.WHITE}{'─' * 70}{C.RESET}\n")
@@ -318,7 +320,8 @@ class AudioStegoCLI:
             coder.on_key_required = request_key
 
             logger.info("Starting analysis")
-            found = coder.analyze_multi_format(input_file, password, use_legacy_kdf)
+            with coder.temp_scope():
+                found = coder.analyze_multi_format(input_file, password, use_legacy_kdf)
 
             if found:
                 logger.info("Analysis complete: hidden data found")
@@ -356,9 +359,6 @@ class AudioStegoCLI:
             filename = os.path.basename(input_file)
             logger.debug(f"Carrier format: {input_format}")
 
-            wav_file = coder._convert_to_wav(input_file)
-            logger.debug(f"Converted {filename} to WAV format")
-
             quality_map = {
                 "low": EncodeMode.LOW_QUALITY,
                 "normal": EncodeMode.NORMAL_QUALITY,
@@ -370,11 +370,15 @@ class AudioStegoCLI:
             )
             logger.info(f"Quality mode: {quality_mode.name}")
 
-            base_file = BaseFileInfoItem(
-                full_path=wav_file,
-                encode_mode=quality_mode,
-                wav_head_length=44,
-            )
+            with coder.temp_scope():
+                wav_file = coder._convert_to_wav(input_file)
+                logger.debug(f"Converted {filename} to WAV format")
+
+                base_file = BaseFileInfoItem(
+                    full_path=wav_file,
+                    encode_mode=quality_mode,
+                    wav_head_length=44,
+                )
 
             capacity_bytes = base_file.max_inner_files_size
             logger.info(
@@ -2,11 +2,16 @@
 import os
 import shutil
 import logging
+import subprocess
 import tempfile
+import numpy as np
+from collections import OrderedDict
+from contextlib import contextmanager
+from concurrent.futures import ProcessPoolExecutor
 import soundfile as sf
 from pathlib import Path
 from pydub import AudioSegment
-from typing import Optional
+from typing import Optional, Any, Callable, Iterator
 from ghostbit.audiostego.core.audio_steganography import (
     Coder,
     EncodeMode,
@@ -20,6 +25,9 @@ import warnings
 warnings.filterwarnings("ignore", category=SyntaxWarning, module="pydub.utils")
 logger = logging.getLogger("ghostbit.audiostego")
 
+_SF_FORMATS = {f".{name.lower()}" for name in sf.available_formats()}
+_FFMPEG = shutil.which("ffmpeg")
+
 
 class AudioMultiFormatCoderException(Exception):
     """Base exception for steganography operations"""
@@ -27,23 +35,43 @@ class AudioMultiFormatCoderException(Exception):
     pass
 
 
+class UnsupportedInputFormatError(AudioMultiFormatCoderException):
+    """Input file extension has no WAV converter"""
+
+    def __init__(self, ext: str, supported: list[str]) -> None:
+        super().__init__(ext, supported)
+        self.ext = ext
+        self.supported = supported
+
+    def __str__(self) -> str:
+        return (
+            f"Unsupported input format: {self.ext}\n"
+            f"Supported formats: {', '.join(self.supported)}"
+        )
+
+
 class AudioMultiFormatCoder(Coder):
     """Coder class with multi-format support"""
 
-    SUPPORTED_INPUT_FORMATS = [".wav", ".flac", ".mp3", ".m4a", ".aiff", ".aif"]
     SUPPORTED_OUTPUT_FORMATS = [".wav", ".flac", ".m4a", ".aiff", ".aif"]
+    STREAM_BLOCK_FRAMES = 1 << 18
+    CONVERTED_CACHE_SIZE = 32
 
-    def __init__(self) -> None:
+    def __init__(self, cache_conversions: bool = False) -> None:
         super().__init__()
-        self.temp_files: list[str] = []
+        self.temp_files: set[str] = set()
+        self.cache_conversions = cache_conversions
+        self.converted_files: OrderedDict[tuple[str, int, int], str] = OrderedDict()
         self.original_input_format: Optional[str] = None
         self.desired_output_format: str = ".wav"
+        self._read_scratch: np.ndarray = np.empty(0, dtype=np.int16)
         logger.debug("MultiFormatCoder initialized")
 
     def __del__(self) -> None:
         """Cleanup temporary files"""
         logger.debug("MultiFormatCoder destructor called, cleaning up temp files")
         self.cleanup_temp_files()
+        self.clear_converted_files()
 
     def cleanup_temp_files(self) -> None:
         """Remove all temporary files"""
@@ -54,17 +82,132 @@ class AudioMultiFormatCoder(Coder):
         logger.info(f"Cleaning up {len(self.temp_files)} temporary files")
         for temp_file in self.temp_files:
             try:
-                if os.path.exists(temp_file):
-                    os.unlink(temp_file)
-                    logger.debug(f"Deleted temp file: {temp_file}")
+                Path(temp_file).unlink(missing_ok=True)
+                logger.debug(f"Deleted temp file: {temp_file}")
             except Exception as e:
                 logger.warning(f"Failed to delete temp file {temp_file}: {e}")
         self.temp_files.clear()
 
+    def clear_converted_files(self) -> None:
+        """Remove all cached WAV conversions of input files"""
+        if not self.converted_files:
+            return
+
+        logger.info(f"Removing {len(self.converted_files)} cached WAV conversions")
+        for converted_file in self.converted_files.values():
+            self._remove_converted_file(converted_file)
+        self.converted_files.clear()
+
+    def _remove_converted_file(self, converted_file: str) -> None:
+        """Delete one cached WAV conversion from disk"""
+        try:
+            Path(converted_file).unlink(missing_ok=True)
+            logger.debug(f"Deleted converted file: {converted_file}")
+        except Exception as e:
+            logger.warning(f"Failed to delete converted file {converted_file}: {e}")
+
+    def _discard_converted(self, wav_file: str) -> None:
+        """Drop and delete the cached conversion behind wav_file, if it is one"""
+        for cache_key, converted_file in self.converted_files.items():
+            if converted_file == wav_file:
+                del self.converted_files[cache_key]
+                self._remove_converted_file(converted_file)
+                return
+
+    @contextmanager
+    def temp_scope(self) -> Iterator["AudioMultiFormatCoder"]:
+        """Remove all temporary and converted WAVs when the block exits"""
+        try:
+            yield self
+        finally:
+            self.cleanup_temp_files()
+            self.clear_converted_files()
+
+    def _new_temp_wav(self, track: bool = True) -> str:
+        """Create an empty temporary WAV path, tracked for cleanup by default"""
+        fd, temp_wav_path = tempfile.mkstemp(suffix=".wav")
+        os.close(fd)
+        if track:
+            self.temp_files.add(temp_wav_path)
+        return temp_wav_path
+
     def _get_file_extension(self, filepath: str) -> str:
         """Get lowercase file extension"""
         return Path(filepath).suffix.lower()
 
+    def _scratch_frames(self, frames: int, channels: int) -> np.ndarray:
+        """Get an int16 (frames, channels) view of the reusable read buffer"""
+        needed = frames * channels
+        if self._read_scratch.size < needed:
+            logger.debug(f"Growing read buffer to {needed} samples")
+            self._read_scratch = np.empty(needed, dtype=np.int16)
+        return self._read_scratch[:needed].reshape(frames, channels)
+
+    def _stream_pcm16(
+        self, input_file: str, output_file: str, format: Optional[str] = None
+    ) -> int:
+        """Copy audio to a PCM_16 file block by block, returning the frame count"""
+        with (
+            sf.SoundFile(input_file) as src,
+            sf.SoundFile(
+                output_file,
+                "w",
+                samplerate=src.samplerate,
+                channels=src.channels,
+                subtype="PCM_16",
+                format=format,
+            ) as dst,
+        ):
+            block = self._scratch_frames(
+                min(src.frames, self.STREAM_BLOCK_FRAMES), src.channels
+            )
+            for frames in src.blocks(out=block):
+                dst.write(frames)
+            logger.debug(f"Streamed {src.frames} frames at {src.samplerate} Hz")
+            return int(src.frames)
+
+    def _wav_via_soundfile(self, input_file: str, temp_wav_path: str) -> None:
+        """Convert to WAV with soundfile"""
+        logger.debug("Using soundfile for FLAC conversion")
+        self._stream_pcm16(input_file, temp_wav_path)
+        logger.info("Conversion successful using soundfile")
+
+    def _wav_via_pydub(self, input_file: str, temp_wav_path: str) -> None:
+        """Convert to WAV with pydub"""
+        logger.debug(
+            f"Using pydub for {self._get_file_extension(input_file)} conversion"
+        )
+        audio = AudioSegment.from_file(input_file).set_sample_width(2)
+        logger.debug(
+            f"Loaded audio: {len(audio)}ms, {audio.channels} channels, {audio.frame_rate} Hz"
+        )
+        samples = np.frombuffer(audio.raw_data, dtype=np.int16).reshape(
+            -1, audio.channels
+        )
+        sf.write(temp_wav_path, samples, audio.frame_rate, subtype="PCM_16")
+        del audio, samples
+        logger.info("Conversion successful using Pydub")
+
+    def _wav_via_ffmpeg(self, input_file: str, temp_wav_path: str) -> None:
+        """Convert to WAV with a single ffmpeg call, falling back to pydub"""
+        if _FFMPEG is None:
+            self._wav_via_pydub(input_file, temp_wav_path)
+            return
+        logger.debug(
+            f"Using ffmpeg for {self._get_file_extension(input_file)} conversion"
+        )
+        _ffmpeg_decode(_FFMPEG, input_file, temp_wav_path)
+        logger.info("Conversion successful using ffmpeg")
+
+    _CONVERT_IN: dict[str, Callable[["AudioMultiFormatCoder", str, str], None]] = {
+        ".flac": _wav_via_soundfile if ".flac" in _SF_FORMATS else _wav_via_ffmpeg,
+        ".mp3": _wav_via_ffmpeg,
+        ".m4a": _wav_via_ffmpeg,
+        ".aiff": _wav_via_ffmpeg,
+        ".aif": _wav_via_ffmpeg,
+    }
+    SUPPORTED_INPUT_FORMATS = [".wav", *_CONVERT_IN]
+
     def _convert_to_wav(self, input_file: str) -> str:
         """Convert supported audio format to WAV"""
         ext = self._get_file_extension(input_file)
@@ -74,49 +217,42 @@ class AudioMultiFormatCoder(Coder):
             logger.debug(f"File already in WAV format: {input_file}")
             return input_file
 
-        if ext not in self.SUPPORTED_INPUT_FORMATS:
+        handler = self._CONVERT_IN.get(ext)
+        if handler is None:
             logger.error(f"Unsupported input format: {ext}")
-            raise AudioMultiFormatCoderException(
-                f"Unsupported input format: {ext}\n"
-                f"Supported formats: {', '.join(self.SUPPORTED_INPUT_FORMATS)}"
-            )
-
-        temp_wav = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        temp_wav.close()
-        temp_wav_path = temp_wav.name
-        self.temp_files.append(temp_wav_path)
-
-        logger.info(f"Converting {ext} to WAV: {input_file} -> {temp_wav_path}")
+            raise UnsupportedInputFormatError(ext, [".wav", *self._CONVERT_IN])
 
         try:
-            if ext in [".flac"]:
-                logger.debug("Using soundfile for FLAC conversion")
-                data, samplerate = sf.read(input_file)
-                logger.debug(f"Read audio: {len(data)} samples at {samplerate} Hz")
-                sf.write(temp_wav_path, data, samplerate, subtype="PCM_16")
-                logger.info("Conversion successful using soundfile")
+            stat = os.stat(input_file)
+        except OSError as e:
+            logger.error(f"Cannot access input file: {input_file}")
+            raise AudioMultiFormatCoderException(f"Conversion failed: {e}")
 
-            else:
-                logger.debug(f"Using pydub for {ext} conversion")
-                audio = AudioSegment.from_file(input_file)
-                logger.debug(
-                    f"Loaded audio: {len(audio)}ms, {audio.channels} channels, {audio.frame_rate} Hz"
-                )
-                audio.export(
-                    temp_wav_path, format="wav", parameters=["-acodec", "pcm_s16le"]
-                )
-                logger.info("Conversion successful using Pydub")
+        cache_key = (os.path.abspath(input_file), stat.st_mtime_ns, stat.st_size)
+        cached_wav = self.converted_files.get(cache_key)
+        if cached_wav and os.path.exists(cached_wav):
+            logger.debug(f"Reusing converted WAV for {input_file}: {cached_wav}")
+            self.converted_files.move_to_end(cache_key)
+            return cached_wav
+
+        temp_wav_path = self._new_temp_wav(track=False)
 
-            return temp_wav_path
+        logger.info(f"Converting {ext} to WAV: {input_file} -> {temp_wav_path}")
 
+        try:
+            handler(self, input_file, temp_wav_path)
         except Exception as e:
             logger.exception(f"Conversion failed for {input_file}")
-            if temp_wav_path in self.temp_files:
-                self.temp_files.remove(temp_wav_path)
-            if os.path.exists(temp_wav_path):
-                os.unlink(temp_wav_path)
+            Path(temp_wav_path).unlink(missing_ok=True)
             raise AudioMultiFormatCoderException(f"Conversion failed: {e}")
 
+        self.converted_files[cache_key] = temp_wav_path
+        while len(self.converted_files) > self.CONVERTED_CACHE_SIZE:
+            _, evicted = self.converted_files.popitem(last=False)
+            logger.debug(f"Evicting cached WAV conversion: {evicted}")
+            self._remove_converted_file(evicted)
+        return temp_wav_path
+
     def _convert_from_wav(self, wav_file: str, output_file: str) -> None:
         """Convert WAV to desired output format"""
         ext = self._get_file_extension(output_file)
@@ -124,7 +260,7 @@ class AudioMultiFormatCoder(Coder):
         if ext == ".wav":
             if wav_file != output_file:
                 logger.debug(f"Copying WAV file: {wav_file} -> {output_file}")
-                shutil.copy2(wav_file, output_file)
+                shutil.copyfile(wav_file, output_file)
             else:
                 logger.debug("Output is same as input WAV, no copy needed")
             return
@@ -139,10 +275,9 @@ class AudioMultiFormatCoder(Coder):
         logger.info(f"Converting WAV to {ext.upper()}: {wav_file} -> {output_file}")
 
         try:
-            if ext == ".flac":
+            if ext == ".flac" and ext in _SF_FORMATS:
                 logger.debug("Using soundfile for FLAC conversion")
-                data, samplerate = sf.read(wav_file)
-                sf.write(output_file, data, samplerate, format="FLAC")
+                self._stream_pcm16(wav_file, output_file, format="FLAC")
                 logger.info("Conversion to FLAC successful using soundfile")
             else:
                 logger.debug(f"Using pydub for {ext} conversion")
@@ -164,6 +299,7 @@ class AudioMultiFormatCoder(Coder):
                     raise AudioMultiFormatCoderException(
                         f"Unsupported output format: {ext}"
                     )
+                del audio
 
             output_size = os.path.getsize(output_file)
             logger.debug(
@@ -237,12 +373,16 @@ class AudioMultiFormatCoder(Coder):
             self.secret_files_info_items.clear()
             print("\n🔄 Adding Secret Files...")
             for secret_file in secret_files:
-                if not os.path.exists(secret_file):
+                try:
+                    secret_size = os.stat(secret_file).st_size
+                except OSError:
                     logger.warning(f"Secret file not found: {secret_file}")
                     print(f"⚠️  Warning: {secret_file} not found, skipping...")
                     continue
 
-                info = SecretFileInfoItem(secret_file, is_in_add_list=True)
+                info = SecretFileInfoItem(
+                    secret_file, is_in_add_list=True, file_size=secret_size
+                )
                 self.secret_files_info_items.append(info)
                 logger.info(
                     f"Added secret file: {info.file_name} ({info.file_size} bytes)"
@@ -253,10 +393,7 @@ class AudioMultiFormatCoder(Coder):
                 logger.error("No valid secret files to encode")
                 raise AudioSteganographyException("No valid secret files to encode")
 
-            temp_encoded_wav = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-            temp_encoded_wav.close()
-            temp_encoded_wav_path = temp_encoded_wav.name
-            self.temp_files.append(temp_encoded_wav_path)
+            temp_encoded_wav_path = self._new_temp_wav()
             logger.debug(f"Created temporary encoded WAV: {temp_encoded_wav_path}")
 
             self.encoder_output_file_path = temp_encoded_wav_path
@@ -277,10 +414,47 @@ class AudioMultiFormatCoder(Coder):
             print("\n✅ Encoding Complete!")
         except Exception as e:
             logger.exception("Encoding failed")
+            self._discard_converted(wav_carrier)
             raise AudioMultiFormatCoderException(f"Encoding failed: {e}")
 
         finally:
             self.cleanup_temp_files()
+            if not self.cache_conversions:
+                self._discard_converted(wav_carrier)
+
+    @classmethod
+    def encode_batch(
+        cls,
+        jobs: list[tuple[str, list[str], str]],
+        password: Optional[str] = None,
+        quality_mode: EncodeMode = EncodeMode.NORMAL_QUALITY,
+        use_legacy_kdf: bool = False,
+        max_workers: Optional[int] = None,
+    ) -> list[str]:
+        """Encode several (carrier, secret files, output) jobs in parallel processes"""
+        if not jobs:
+            return []
+
+        workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+        logger.info(f"Starting batch encode: {len(jobs)} jobs, {workers} workers")
+
+        args = [
+            (
+                cls,
+                carrier_file,
+                secret_files,
+                output_file,
+                password,
+                quality_mode,
+                use_legacy_kdf,
+            )
+            for carrier_file, secret_files, output_file in jobs
+        ]
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            outputs = list(executor.map(_encode_one, args))
+
+        logger.info(f"Batch encode complete: {len(outputs)} files written")
+        return outputs
 
     def decode_files_multi_format(
         self,
@@ -361,10 +535,13 @@ class AudioMultiFormatCoder(Coder):
 
         except Exception as e:
             logger.exception("Decoding failed")
+            self._discard_converted(wav_file)
             raise AudioMultiFormatCoderException(f"Hidden file extraction failed: {e}")
 
         finally:
             self.cleanup_temp_files()
+            if not self.cache_conversions:
+                self._discard_converted(wav_file)
 
     def analyze_multi_format(
         self,
@@ -422,7 +599,66 @@ class AudioMultiFormatCoder(Coder):
 
         except AudioSteganographyException as e:
             logger.error(f"❌ Analysis failed: {e}")
+            self._discard_converted(wav_file)
             return False
 
         finally:
             self.cleanup_temp_files()
+            if not self.cache_conversions:
+                self._discard_converted(wav_file)
+
+
+def _ffmpeg_decode(ffmpeg: str, input_file: str, output_file: str) -> None:
+    """Decode an audio file straight to a 16-bit WAV with a 44-byte header"""
+    result = subprocess.run(
+        [
+            ffmpeg,
+            "-nostdin",
+            "-v",
+            "error",
+            "-y",
+            "-i",
+            input_file,
+            "-vn",
+            "-map_metadata",
+            "-1",
+            "-fflags",
+            "+bitexact",
+            "-flags:a",
+            "+bitexact",
+            "-acodec",
+            "pcm_s16le",
+            "-f",
+            "wav",
+            output_file,
+        ],
+        stdin=subprocess.DEVNULL,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.PIPE,
+    )
+    if result.returncode != 0:
+        error = result.stderr.decode(errors="replace").strip()
+        raise AudioMultiFormatCoderException(f"ffmpeg decode failed: {error}")
+
+
+def _encode_one(args: tuple[Any, ...]) -> str:
+    """Run a single encode job in a worker process with its own coder"""
+    (
+        coder_cls,
+        carrier_file,
+        secret_files,
+        output_file,
+        password,
+        quality_mode,
+        use_legacy_kdf,
+    ) = args
+    with coder_cls().temp_scope() as coder:
+        coder.encode_files_multi_format(
+            carrier_file=carrier_file,
+            secret_files=secret_files,
+            output_file=output_file,
+            password=password,
+            quality_mode=quality_mode,
+            use_legacy_kdf=use_legacy_kdf,
+        )
+    return str(output_file)
@@ -10,7 +10,7 @@ from dataclasses import dataclass
 from Crypto.Util.Padding import pad
 from argon2.low_level import hash_secret_raw, Type as Argon2Type
 from cryptography.hazmat.primitives.ciphers.aead import AESGCM
-from typing import List, Optional, Callable, BinaryIO, Any, Type
+from typing import List, Optional, Callable, BinaryIO, Any, Type, Union
 from types import TracebackType
 
 logger = logging.getLogger("ghostbit.audiostego")
@@ -60,12 +60,13 @@ class SecretFileInfoItem:
     def __post_init__(self) -> None:
         self.file_name = os.path.basename(self.full_path)
         if self.is_in_add_list:
-            if os.path.exists(self.full_path):
-                self.file_size = os.path.getsize(self.full_path)
+            try:
+                if not self.file_size:
+                    self.file_size = os.stat(self.full_path).st_size
                 logger.debug(
                     f"SecretFileInfoItem created: {self.file_name} ({self.file_size} bytes)"
                 )
-            else:
+            except OSError:
                 logger.warning(
                     f"SecretFileInfoItem file does not exist: {self.full_path}"
                 )
@@ -96,16 +97,17 @@ class BaseFileInfoItem:
 
     def __post_init__(self) -> None:
         self.file_name = os.path.basename(self.full_path)
-        if os.path.exists(self.full_path):
-            self.file_size = os.path.getsize(self.full_path)
-            self.max_inner_files_size = (
-                self.file_size - self.wav_head_length - 104
-            ) // self.encode_mode.value
-            logger.debug(
-                f"BaseFileInfoItem: {self.file_name}, size={self.file_size}, capacity={self.max_inner_files_size}"
-            )
-        else:
+        try:
+            self.file_size = os.stat(self.full_path).st_size
+        except OSError:
             logger.warning(f"BaseFileInfoItem file does not exist: {self.full_path}")
+            return
+        self.max_inner_files_size = (
+            self.file_size - self.wav_head_length - 104
+        ) // self.encode_mode.value
+        logger.debug(
+            f"BaseFileInfoItem: {self.file_name}, size={self.file_size}, capacity={self.max_inner_files_size}"
+        )
 
     @property
     def remains_inner_files_size(self) -> int:
@@ -700,7 +702,9 @@ class Coder:
 
         return result
 
-    def decode_data(self, base_data: bytes, length: int) -> bytearray:
+    def decode_data(
+        self, base_data: Union[bytes, memoryview], length: int
+    ) -> bytearray:
         """Decode secret data from base data"""
         result_size = length // self.decode_quality_mode.value
 
@@ -931,7 +935,7 @@ class Coder:
         if find_to > stream_length or find_to == -1:
             find_to = stream_length
 
-        buffer = stream.read(find_to)
+        buffer = memoryview(stream.read(find_to))
         stream.seek(current_pos)
 
         self.decode_quality_mode = EncodeMode.NORMAL_QUALITY
@@ -1,12 +1,19 @@
 # src/ghostbit/audiostego/skills/__init__.py
 """Audio Skills System for LLM integration"""
 
+import os
 import re
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Optional
 
 AUDIO_SKILLS_DIR = Path(__file__).parent
 
+_TITLE_RE = re.compile(r"^# (.+)$", re.MULTILINE)
+_HEADING_RE = re.compile(r"^#+", re.MULTILINE)
+_SECTION_RE = re.compile(r"^## (.*)$", re.MULTILINE)
+_EXAMPLE_RE = re.compile(r"```(\w+)?\n(.*?)```", re.DOTALL)
+
 
 class AudioSkill:
     """Represents an audio skill with documentation"""
@@ -15,11 +22,14 @@ class AudioSkill:
         self.name = name
         self.path = path
         self.content = (path / "SKILL.md").read_text()
+        self._section_cache: Dict[str, str] = {}
+        self._all_sections: Optional[Dict[str, str]] = None
+        self._examples: Optional[List[Dict[str, str]]] = None
         self._parse_metadata()
 
     def _parse_metadata(self) -> None:
         """Parse metadata from skill markdown"""
-        title_match = re.search(r"^# (.+)$", self.content, re.MULTILINE)
+        title_match = _TITLE_RE.search(self.content)
         self.title = title_match.group(1) if title_match else self.name
 
         lines = self.content.split("\n")
@@ -33,74 +43,74 @@ class AudioSkill:
                 self.description = line.strip()
                 break
 
+        # (level, line start, line end) for every line starting with '#'
+        self._headings = [
+            (m.end() - m.start(), m.start(), self.content.find("\n", m.start()))
+            for m in _HEADING_RE.finditer(self.content)
+        ]
+
     def get_section(self, section_name: str) -> str:
         """Extract a specific section from the skill"""
-        lines = self.content.split("\n")
-        in_section = False
-        section_content: list[str] = []
-        section_level = 0
-
-        for line in lines:
-            if re.match(rf"^##+ {section_name}", line):
-                in_section = True
-                match = re.match(r"^(#+)", line)
-                if match:
-                    section_level = len(match.group(1))
-                else:
-                    section_level = 0
-                continue
-
-            if in_section and re.match(r"^#+", line):
-                match = re.match(r"^(#+)", line)
-                if match:
-                    current_level = len(match.group(1))
-                else:
-                    current_level = 0
-                if current_level <= section_level:
-                    break
+        if section_name in self._section_cache:
+            return self._section_cache[section_name]
+
+        start_re = re.compile(rf"^##+ {section_name}", re.MULTILINE)
+        pieces: list[str] = []
+        pos = section_level = -1
+        for level, start, end in self._headings:
+            if start_re.match(self.content, start):
+                # a matching heading (re)opens the section and is itself dropped
+                if pos != -1:
+                    pieces.append(self.content[pos:start])
+                section_level = level
+                pos = len(self.content) if end == -1 else end + 1
+            elif pos != -1 and level <= section_level:
+                pieces.append(self.content[pos:start])
+                pos = -1
+                break
 
-            if in_section:
-                section_content.append(line)
+        if pos != -1:
+            pieces.append(self.content[pos:])
+        section = "".join(pieces).strip()
 
-        return "\n".join(section_content).strip()
+        self._section_cache[section_name] = section
+        return section
 
     def get_all_sections(self) -> Dict[str, str]:
         """Get all sections as a dictionary"""
-        sections = {}
-        lines = self.content.split("\n")
-        current_section = None
-        section_content: list[str] = []
+        if self._all_sections is None:
+            # [preamble, title1, body1, title2, body2, ...]
+            parts = _SECTION_RE.split(self.content)
+            sections = {}
+            for title, body in zip(parts[1::2], parts[2::2]):
+                title = title.strip()
+                if title:
+                    sections[title] = body.strip()
 
-        for line in lines:
-            if line.startswith("## "):
-                if current_section:
-                    sections[current_section] = "\n".join(section_content).strip()
-                current_section = line[3:].strip()
-                section_content = []
-            elif current_section:
-                section_content.append(line)
+            self._all_sections = sections
 
-        if current_section:
-            sections[current_section] = "\n".join(section_content).strip()
-
-        return sections
+        return dict(self._all_sections)
 
     def get_examples(self) -> List[Dict[str, str]]:
         """Extract code examples from the skill"""
-        examples = []
-
-        pattern = r"```(\w+)?\n(.*?)```"
-        matches = re.findall(pattern, self.content, re.DOTALL)
-
-        for lang, code in matches:
-            examples.append({"language": lang or "python", "code": code.strip()})
+        if self._examples is None:
+            self._examples = [
+                {"language": lang or "python", "code": code.strip()}
+                for lang, code in _EXAMPLE_RE.findall(self.content)
+            ]
 
-        return examples
+        return [dict(example) for example in self._examples]
 
     def __str__(self) -> str:
         return f"AudioSkill(name='{self.name}', title='{self.title}')"
 
 
+@lru_cache(maxsize=128)
+def _load_audio_skill_cached(name: str, skill_path: Path, mtime_ns: int) -> AudioSkill:
+    """Parse a skill once per SKILL.md modification time"""
+    return AudioSkill(name, skill_path)
+
+
 class AudioSkillLoader:
     """Load and manage skills"""
 
@@ -110,28 +120,34 @@ class AudioSkillLoader:
     def list_skills(self) -> List[str]:
         """List all available skill names"""
         skills = []
-        for item in self.skills_dir.iterdir():
-            if item.is_dir() and not item.name.startswith("_"):
-                skill_file = item / "SKILL.md"
-                if skill_file.exists():
-                    skills.append(item.name)
+        # DirEntry.is_dir() uses the dirent type, so only SKILL.md is stat'ed
+        with os.scandir(self.skills_dir) as entries:
+            for entry in entries:
+                if (
+                    entry.is_dir()
+                    and not entry.name.startswith("_")
+                    and os.path.exists(os.path.join(entry.path, "SKILL.md"))
+                ):
+                    skills.append(entry.name)
         return sorted(skills)
 
     def load_skill(self, name: str) -> AudioSkill:
         """Load a specific skill by name"""
         skill_path = self.skills_dir / name
-
-        if not skill_path.exists():
-            raise ValueError(
-                f"Skill '{name}' not found. "
-                f"Available: {', '.join(self.list_skills())}"
-            )
-
         skill_file = skill_path / "SKILL.md"
-        if not skill_file.exists():
-            raise ValueError(f"SKILL.md not found in skill '{name}'")
 
-        return AudioSkill(name, skill_path)
+        # one stat on the happy path; the directory is only checked on failure
+        try:
+            mtime_ns = skill_file.stat().st_mtime_ns
+        except OSError:
+            if not skill_path.exists():
+                raise ValueError(
+                    f"Skill '{name}' not found. "
+                    f"Available: {', '.join(self.list_skills())}"
+                ) from None
+            raise ValueError(f"SKILL.md not found in skill '{name}'") from None
+
+        return _load_audio_skill_cached(name, skill_path, mtime_ns)
 
     def get_all_skills(self) -> List[AudioSkill]:
         """Get all available skills"""
@@ -152,15 +168,12 @@ class AudioSkillLoader:
         else:
             skills = [self.load_skill(name) for name in skill_names]
 
-        context = "# AudioStego Skills Documentation\n\n"
-        context += "This documentation provides guidance for using AudioStego.\n\n"
-
-        for skill in skills:
-            context += "\n---\n\n"
-            context += skill.content
-            context += "\n\n"
+        header = (
+            "# AudioStego Skills Documentation\n\n"
+            "This documentation provides guidance for using AudioStego.\n\n"
+        )
 
-        return context
+        return header + "".join(f"\n---\n\n{skill.content}\n\n" for skill in skills)
 
 
 def load_audio_skill(name: str) -> AudioSkill:
@@ -101,7 +101,7 @@ def audio_encode(
 
         # Execute with stdout capture (protocol integrity)
         coder = AudioMultiFormatCoder()
-        with capture_stdout():
+        with capture_stdout(), coder.temp_scope():
             coder.encode_files_multi_format(
                 carrier_file=input_path,
                 secret_files=secret_file_paths,
@@ -188,7 +188,7 @@ def audio_decode(
 
             coder.on_key_required = _supply_password
 
-        with capture_stdout():
+        with capture_stdout(), coder.temp_scope():
             coder.decode_files_multi_format(
                 encoded_file=input_path,
                 output_dir=output_dir,
@@ -258,7 +258,7 @@ def audio_capacity(
         encode_mode = map_quality(quality)
 
         coder = AudioMultiFormatCoder()
-        with capture_stdout():
+        with capture_stdout(), coder.temp_scope():
             capacity_bytes = coder.calculate_capacity(
                 audio_file=input_path,
                 quality_mode=encode_mode,
@@ -331,7 +331,7 @@ def audio_analyze(
 
             coder.on_key_required = _supply_password
 
-        with capture_stdout():
+        with capture_stdout(), coder.temp_scope():
             has_hidden_data = coder.analyze_multi_format(
                 audio_file=input_path,
                 password=password,
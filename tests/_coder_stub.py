@@ -0,0 +1,86 @@
+from contextlib import contextmanager
+from typing import Any, Callable, Iterator, Optional
+from ghostbit.audiostego.core.audio_steganography import (
+    EncodeMode,
+    KeyRequiredEventArgs,
+)
+
+"""
+Plain stand-in for AudioMultiFormatCoder in CLI tests that only check what was called
+"""
+
+
+class CoderStub:
+    """Record each multi-format call's arguments; raise or report as configured"""
+
+    def __init__(self, raises: Optional[Exception] = None, found: bool = True) -> None:
+        self.raises = raises
+        self.found = found
+        self.calls: dict[str, dict[str, Any]] = {}
+        self.on_encoded_element: Optional[Callable[[], None]] = None
+        self.on_decoded_element: Optional[Callable[[], None]] = None
+        self.on_key_required: Optional[Callable[[KeyRequiredEventArgs], None]] = None
+
+    @contextmanager
+    def temp_scope(self) -> Iterator["CoderStub"]:
+        """Match the real coder's cleanup scope; the stub makes no files"""
+        yield self
+
+    def _record(self, name: str, args: dict[str, Any]) -> None:
+        self.calls[name] = args
+        if self.raises is not None:
+            raise self.raises
+
+    def encode_files_multi_format(
+        self,
+        carrier_file: str,
+        secret_files: list[str],
+        output_file: str,
+        password: Optional[str] = None,
+        quality_mode: EncodeMode = EncodeMode.NORMAL_QUALITY,
+        use_legacy_kdf: bool = False,
+    ) -> None:
+        self._record(
+            "encode",
+            {
+                "carrier_file": carrier_file,
+                "secret_files": secret_files,
+                "output_file": output_file,
+                "password": password,
+                "quality_mode": quality_mode,
+                "use_legacy_kdf": use_legacy_kdf,
+            },
+        )
+
+    def decode_files_multi_format(
+        self,
+        encoded_file: str,
+        output_dir: str,
+        password: Optional[str] = None,
+        use_legacy_kdf: bool = False,
+    ) -> None:
+        self._record(
+            "decode",
+            {
+                "encoded_file": encoded_file,
+                "output_dir": output_dir,
+                "password": password,
+                "use_legacy_kdf": use_legacy_kdf,
+            },
+        )
+
+    def analyze_multi_format(
+        self,
+        audio_file: str,
+        password: Optional[str] = None,
+        use_legacy_kdf: bool = False,
+    ) -> bool:
+        self._record(
+            "analyze",
+            {
+                "audio_file": audio_file,
+                "password": password,
+                "use_legacy_kdf": use_legacy_kdf,
+            },
+        )
+        return self.found
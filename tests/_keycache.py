@@ -0,0 +1,14 @@
+from functools import lru_cache
+from ghostbit.audiostego.core.audio_steganography import Coder
+
+"""
+Memoized key material for tests that need a keyed Coder but do not test derivation
+"""
+
+
+@lru_cache(maxsize=64)
+def derived(password: str) -> tuple[bytes, bytes]:
+    """Return (aes_key, key_verif_block) from set_key_unicode(password)"""
+    coder = Coder()
+    coder.set_key_unicode(password)
+    return bytes(coder.aes_key), bytes(coder.key_verif_block)
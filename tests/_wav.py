@@ -0,0 +1,30 @@
+import struct
+
+"""
+Canonical 44-byte PCM WAV header for synthetic test carriers
+"""
+
+_HEADER = struct.Struct("<4sI4s4sIHHIIHH4sI")
+
+
+def build_wav(
+    frames: bytes, channels: int = 1, sample_rate: int = 44100, sample_width: int = 2
+) -> bytes:
+    """Prefix raw PCM frames with a RIFF/WAVE header"""
+    block_align = channels * sample_width
+    header = _HEADER.pack(
+        b"RIFF",
+        36 + len(frames),
+        b"WAVE",
+        b"fmt ",
+        16,
+        1,
+        channels,
+        sample_rate,
+        sample_rate * block_align,
+        block_align,
+        sample_width * 8,
+        b"data",
+        len(frames),
+    )
+    return header + frames
@@ -0,0 +1,28 @@
+import os
+import shutil
+import pytest
+from pathlib import Path
+from _wav import build_wav
+
+_SILENCE_5S = bytes(44100 * 5 * 2)
+
+# tmpfs root for tmp_path when there is room; pytest keeps the last 3 runs
+_SHM = Path("/dev/shm")
+_SHM_MIN_FREE = 256 * 1024 * 1024
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    """Put tmp_path under /dev/shm on Linux unless a temp root is already chosen"""
+    if "PYTEST_DEBUG_TEMPROOT" in os.environ or not _SHM.is_dir():
+        return
+    if not os.access(_SHM, os.W_OK) or shutil.disk_usage(_SHM).free < _SHM_MIN_FREE:
+        return
+    os.environ["PYTEST_DEBUG_TEMPROOT"] = str(_SHM)
+
+
+@pytest.fixture(scope="session")
+def silent_wav_5s(tmp_path_factory) -> Path:
+    """5 seconds of 16-bit mono 44.1 kHz silence, written once per session"""
+    path = tmp_path_factory.mktemp("carriers") / "silent_5s.wav"
+    path.write_bytes(build_wav(_SILENCE_5S))
+    return path
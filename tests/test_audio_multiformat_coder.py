@@ -1,5 +1,7 @@
 #!/usr/bin/env python3
 import os
+import pickle
+import shutil
 import pytest
 import tempfile
 import numpy as np
@@ -8,8 +10,12 @@ from unittest.mock import MagicMock, patch
 from ghostbit.audiostego.core.audio_multiformat_coder import (
     AudioMultiFormatCoder,
     AudioMultiFormatCoderException,
+    UnsupportedInputFormatError,
+)
+from ghostbit.audiostego.core.audio_steganography import (
+    EncodeMode,
+    AudioSteganographyException,
 )
-from ghostbit.audiostego.core.audio_steganography import EncodeMode
 
 """
 Tests for audiostego.core.audio_multiformat_coder module
@@ -25,7 +31,7 @@ class TestAudioMultiFormatCoderInitialization:
         """Test AudioMultiFormatCoder initializes correctly"""
         coder = AudioMultiFormatCoder()
 
-        assert coder.temp_files == []
+        assert coder.temp_files == set()
         assert coder.original_input_format is None
         assert coder.desired_output_format == ".wav"
 
@@ -35,6 +41,10 @@ class TestAudioMultiFormatCoderInitialization:
         assert ".flac" in AudioMultiFormatCoder.SUPPORTED_INPUT_FORMATS
         assert ".mp3" in AudioMultiFormatCoder.SUPPORTED_INPUT_FORMATS
         assert ".m4a" in AudioMultiFormatCoder.SUPPORTED_INPUT_FORMATS
+        assert AudioMultiFormatCoder.SUPPORTED_INPUT_FORMATS == [
+            ".wav",
+            *AudioMultiFormatCoder._CONVERT_IN,
+        ]
 
         assert ".wav" in AudioMultiFormatCoder.SUPPORTED_OUTPUT_FORMATS
         assert ".flac" in AudioMultiFormatCoder.SUPPORTED_OUTPUT_FORMATS
@@ -87,13 +97,13 @@ class TestAudioMultiFormatCoderTempFileCleanup:
 
         assert len(coder.temp_files) == 0
 
-    def test_cleanup_temp_files_with_files(self) -> None:
+    def test_cleanup_temp_files_with_files(self, tmp_path: Path) -> None:
         """Test cleanup removes temp files"""
         coder = AudioMultiFormatCoder()
 
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            temp_path = f.name
-            coder.temp_files.append(temp_path)
+        temp_path = str(tmp_path / "temp")
+        Path(temp_path).touch()
+        coder.temp_files.add(temp_path)
 
         assert os.path.exists(temp_path)
 
@@ -102,22 +112,35 @@ class TestAudioMultiFormatCoderTempFileCleanup:
         assert not os.path.exists(temp_path)
         assert len(coder.temp_files) == 0
 
+    def test_new_temp_wav_is_tracked(self) -> None:
+        """Test _new_temp_wav creates an empty tracked WAV path"""
+        coder = AudioMultiFormatCoder()
+
+        temp_path = coder._new_temp_wav()
+
+        assert temp_path.endswith(".wav")
+        assert os.path.getsize(temp_path) == 0
+        assert coder.temp_files == {temp_path}
+
+        coder.cleanup_temp_files()
+        assert not os.path.exists(temp_path)
+
     def test_cleanup_handles_nonexistent_files(self) -> None:
         """Test cleanup handles files that don't exist"""
         coder = AudioMultiFormatCoder()
-        coder.temp_files.append("/nonexistent/file.wav")
+        coder.temp_files.add("/nonexistent/file.wav")
 
         coder.cleanup_temp_files()
 
         assert len(coder.temp_files) == 0
 
-    def test_destructor_calls_cleanup(self) -> None:
+    def test_destructor_calls_cleanup(self, tmp_path: Path) -> None:
         """Test __del__ calls cleanup_temp_files"""
-        with tempfile.NamedTemporaryFile(delete=False) as f:
-            temp_path = f.name
+        temp_path = str(tmp_path / "temp")
+        Path(temp_path).touch()
 
         coder = AudioMultiFormatCoder()
-        coder.temp_files.append(temp_path)
+        coder.temp_files.add(temp_path)
 
         assert os.path.exists(temp_path)
 
@@ -147,52 +170,329 @@ class TestAudioMultiFormatCoderConvertToWav:
             coder._convert_to_wav("test.xyz")
 
         assert "Unsupported input format" in str(exc_info.value)
+        assert isinstance(exc_info.value, UnsupportedInputFormatError)
+        assert exc_info.value.ext == ".xyz"
+
+    def test_unsupported_input_format_error_pickles(self) -> None:
+        """Test UnsupportedInputFormatError survives a pickle round trip"""
+        error = UnsupportedInputFormatError(".ogg", [".wav", ".flac"])
+
+        restored = pickle.loads(pickle.dumps(error))
+
+        assert isinstance(restored, UnsupportedInputFormatError)
+        assert restored.ext == ".ogg"
+        assert restored.supported == [".wav", ".flac"]
+        assert str(restored) == str(error)
 
     @patch("ghostbit.audiostego.core.audio_multiformat_coder.sf")
-    def test_convert_to_wav_flac_with_soundfile(self, mock_sf: MagicMock) -> None:
+    def test_convert_to_wav_flac_with_soundfile(
+        self, mock_sf: MagicMock, tmp_path: Path
+    ) -> None:
         """Test _convert_to_wav FLAC with soundfile"""
         coder = AudioMultiFormatCoder()
 
-        mock_audio_data = np.zeros((44100, 2))
-        mock_sf.read.return_value = (mock_audio_data, 44100)
+        block = np.zeros((44100, 2), dtype=np.int16)
+        mock_src = MagicMock(frames=44100, channels=2, samplerate=44100)
+        mock_src.blocks.return_value = [block]
+        mock_dst = MagicMock()
+        mock_sf.SoundFile.side_effect = [
+            MagicMock(__enter__=MagicMock(return_value=mock_src)),
+            MagicMock(__enter__=MagicMock(return_value=mock_dst)),
+        ]
 
-        with tempfile.NamedTemporaryFile(suffix=".flac", delete=False) as f:
-            f.write(b"RIFF" + b"\x00" * 40)
-            input_file = f.name
+        input_file = str(tmp_path / "input.flac")
+        Path(input_file).write_bytes(b"RIFF" + b"\x00" * 40)
 
         try:
             result = coder._convert_to_wav(input_file)
 
             assert result.endswith(".wav")
-            assert result in coder.temp_files
-            mock_sf.read.assert_called_once_with(input_file)
+            assert result in coder.converted_files.values()
+            assert mock_sf.SoundFile.call_args_list[0].args == (input_file,)
+            assert mock_sf.SoundFile.call_args_list[1].args == (result, "w")
+            assert mock_sf.SoundFile.call_args_list[1].kwargs["subtype"] == "PCM_16"
+            out = mock_src.blocks.call_args.kwargs["out"]
+            assert out.shape == (44100, 2)
+            assert out.dtype == np.int16
+            mock_dst.write.assert_called_once_with(block)
         finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
-            coder.cleanup_temp_files()
+            coder.clear_converted_files()
 
+    @patch("ghostbit.audiostego.core.audio_multiformat_coder._FFMPEG", None)
     @patch("ghostbit.audiostego.core.audio_multiformat_coder.AudioSegment")
-    def test_convert_to_wav_mp3_with_pydub(self, mock_audio_segment: MagicMock) -> None:
+    def test_convert_to_wav_mp3_with_pydub(
+        self, mock_audio_segment: MagicMock, tmp_path: Path
+    ) -> None:
         """Test _convert_to_wav MP3 with pydub"""
         coder = AudioMultiFormatCoder()
 
         mock_audio = MagicMock()
         mock_audio_segment.from_file.return_value = mock_audio
+        mock_pcm = mock_audio.set_sample_width.return_value
+        mock_pcm.raw_data = bytes(400)
+        mock_pcm.channels = 2
+        mock_pcm.frame_rate = 44100
 
-        with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as f:
-            input_file = f.name
+        input_file = str(tmp_path / "input.mp3")
+        Path(input_file).touch()
 
         try:
             result = coder._convert_to_wav(input_file)
 
             assert result.endswith(".wav")
-            assert result in coder.temp_files
+            assert result in coder.converted_files.values()
             mock_audio_segment.from_file.assert_called_once_with(input_file)
-            mock_audio.export.assert_called_once()
+            mock_audio.set_sample_width.assert_called_once_with(2)
+            mock_pcm.export.assert_not_called()
+        finally:
+            coder.clear_converted_files()
+
+    @patch("ghostbit.audiostego.core.audio_multiformat_coder._FFMPEG", None)
+    @patch("ghostbit.audiostego.core.audio_multiformat_coder.AudioSegment.from_file")
+    def test_convert_to_wav_pydub_writes_pcm16(
+        self, mock_from_file: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test _convert_to_wav writes the decoded pydub audio as a 16-bit WAV"""
+        import soundfile as sf
+        from pydub import AudioSegment
+
+        coder = AudioMultiFormatCoder()
+        samples = np.arange(-500, 500, dtype=np.int16)
+        mock_from_file.return_value = AudioSegment(
+            samples.tobytes(), sample_width=2, frame_rate=8000, channels=1
+        )
+
+        input_file = str(tmp_path / "input.mp3")
+        Path(input_file).touch()
+
+        try:
+            result = coder._convert_to_wav(input_file)
+
+            data, samplerate = sf.read(result, dtype="int16")
+            assert sf.info(result).subtype == "PCM_16"
+            assert samplerate == 8000
+            assert np.array_equal(data, samples)
         finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
+            coder.clear_converted_files()
+
+    @patch("ghostbit.audiostego.core.audio_multiformat_coder._FFMPEG", None)
+    @patch("ghostbit.audiostego.core.audio_multiformat_coder.AudioSegment")
+    def test_convert_to_wav_reuses_cached_conversion(
+        self, mock_audio_segment: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test _convert_to_wav converts an unchanged input only once"""
+        from pydub import AudioSegment
+
+        coder = AudioMultiFormatCoder()
+        mock_audio_segment.from_file.return_value = AudioSegment.silent(duration=10)
+
+        input_file = str(tmp_path / "input.mp3")
+        Path(input_file).touch()
+
+        try:
+            first = coder._convert_to_wav(input_file)
             coder.cleanup_temp_files()
+            second = coder._convert_to_wav(input_file)
+
+            assert first == second
+            mock_audio_segment.from_file.assert_called_once_with(input_file)
+
+            with open(input_file, "wb") as f:
+                f.write(b"changed")
+            third = coder._convert_to_wav(input_file)
+
+            assert third != first
+            assert mock_audio_segment.from_file.call_count == 2
+        finally:
+            coder.clear_converted_files()
+
+    def test_convert_to_wav_mp3_with_ffmpeg(self) -> None:
+        """Test _convert_to_wav decodes MP3 to a 16-bit WAV with ffmpeg"""
+        import soundfile as sf
+
+        coder = AudioMultiFormatCoder()
+
+        with patch(
+            "ghostbit.audiostego.core.audio_multiformat_coder.AudioSegment"
+        ) as mock_audio_segment:
+            result = coder._convert_to_wav(str(fixture_dir / "test_carrier.mp3"))
+
+        try:
+            mock_audio_segment.from_file.assert_not_called()
+            info = sf.info(result)
+            assert info.subtype == "PCM_16"
+            assert info.frames > 0
+            with open(result, "rb") as f:
+                assert f.read(40)[36:40] == b"data"
+        finally:
+            coder.clear_converted_files()
+
+    def test_convert_to_wav_ffmpeg_failure(self, tmp_path: Path) -> None:
+        """Test _convert_to_wav surfaces ffmpeg decode errors"""
+        coder = AudioMultiFormatCoder()
+
+        input_file = str(tmp_path / "input.mp3")
+        Path(input_file).touch()
+
+        with pytest.raises(AudioMultiFormatCoderException) as exc_info:
+            coder._convert_to_wav(input_file)
+
+        assert "ffmpeg decode failed" in str(exc_info.value)
+        assert coder.converted_files == {}
+
+    def test_clear_converted_files(self) -> None:
+        """Test clear_converted_files removes cached conversions"""
+        coder = AudioMultiFormatCoder()
+
+        converted = coder._convert_to_wav(str(fixture_dir / "test_carrier.flac"))
+        assert os.path.exists(converted)
+
+        coder.clear_converted_files()
+
+        assert not os.path.exists(converted)
+        assert coder.converted_files == {}
+
+    def test_temp_scope_removes_temp_and_converted_files(self) -> None:
+        """Test temp_scope removes temp and converted WAVs even on error"""
+        coder = AudioMultiFormatCoder()
+
+        with pytest.raises(RuntimeError):
+            with coder.temp_scope() as scoped:
+                assert scoped is coder
+                converted = coder._convert_to_wav(
+                    str(fixture_dir / "test_carrier.flac")
+                )
+                temp_path = coder._new_temp_wav()
+                raise RuntimeError("job died")
+
+        assert not os.path.exists(converted)
+        assert not os.path.exists(temp_path)
+        assert coder.temp_files == set()
+        assert coder.converted_files == {}
+
+    def test_converted_files_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Test the conversion cache is bounded and deletes evicted WAVs"""
+        coder = AudioMultiFormatCoder()
+        coder.CONVERTED_CACHE_SIZE = 2
+
+        inputs = []
+        for name in ("a", "b", "c"):
+            path = tmp_path / f"{name}.flac"
+            shutil.copyfile(fixture_dir / "test_carrier.flac", path)
+            inputs.append(str(path))
+
+        try:
+            wav_a = coder._convert_to_wav(inputs[0])
+            wav_b = coder._convert_to_wav(inputs[1])
+            assert coder._convert_to_wav(inputs[0]) == wav_a
+            wav_c = coder._convert_to_wav(inputs[2])
+
+            assert list(coder.converted_files.values()) == [wav_a, wav_c]
+            assert not os.path.exists(wav_b)
+            assert os.path.exists(wav_a)
+            assert os.path.exists(wav_c)
+        finally:
+            coder.clear_converted_files()
+
+    def test_failed_decode_removes_converted_wav(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a failed decode deletes the WAV converted for it"""
+        coder = AudioMultiFormatCoder()
+        analyzed: list[str] = []
+
+        def fail(wav_file: str) -> None:
+            analyzed.append(wav_file)
+            raise AudioSteganographyException("bad header")
+
+        monkeypatch.setattr(coder, "analyze_wav", fail)
+
+        with pytest.raises(AudioMultiFormatCoderException):
+            coder.decode_files_multi_format(
+                str(fixture_dir / "test_carrier.flac"), str(tmp_path)
+            )
+
+        assert analyzed and not os.path.exists(analyzed[0])
+        assert coder.converted_files == {}
+
+    def test_analyze_removes_converted_wav_by_default(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test a completed analysis deletes the WAV converted for it"""
+        coder = AudioMultiFormatCoder()
+        analyzed: list[str] = []
+
+        def no_hidden_data(wav_file: str) -> MagicMock:
+            analyzed.append(wav_file)
+            return MagicMock(h22_version=None)
+
+        monkeypatch.setattr(coder, "analyze_wav", no_hidden_data)
+
+        assert (
+            coder.analyze_multi_format(str(fixture_dir / "test_carrier.flac")) is False
+        )
+
+        assert analyzed and not os.path.exists(analyzed[0])
+        assert coder.converted_files == {}
+
+    def test_analyze_keeps_converted_wav_when_caching(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test cache_conversions keeps the converted WAV for the next call"""
+        coder = AudioMultiFormatCoder(cache_conversions=True)
+        analyzed: list[str] = []
+
+        def no_hidden_data(wav_file: str) -> MagicMock:
+            analyzed.append(wav_file)
+            return MagicMock(h22_version=None)
+
+        monkeypatch.setattr(coder, "analyze_wav", no_hidden_data)
+        input_file = str(fixture_dir / "test_carrier.flac")
+
+        with coder.temp_scope():
+            coder.analyze_multi_format(input_file)
+            coder.analyze_multi_format(input_file)
+
+            assert analyzed[0] == analyzed[1]
+            assert os.path.exists(analyzed[0])
+
+        assert not os.path.exists(analyzed[0])
+
+    def test_convert_to_wav_missing_file(self) -> None:
+        """Test _convert_to_wav with a missing input file raises exception"""
+        coder = AudioMultiFormatCoder()
+
+        with pytest.raises(AudioMultiFormatCoderException) as exc_info:
+            coder._convert_to_wav("/nonexistent/file.mp3")
+
+        assert "Conversion failed" in str(exc_info.value)
+
+    def test_convert_to_wav_dispatches_by_extension(self, tmp_path: Path) -> None:
+        """Test _convert_to_wav picks its handler from _CONVERT_IN"""
+        calls = []
+
+        class OggCoder(AudioMultiFormatCoder):
+            _CONVERT_IN = {
+                **AudioMultiFormatCoder._CONVERT_IN,
+                ".ogg": lambda self, src, dst: calls.append((src, dst)),
+            }
+
+        coder = OggCoder()
+        input_file = str(fixture_dir / "test_carrier.flac")
+        ogg_file = str(tmp_path / "carrier.ogg")
+        shutil.copyfile(input_file, ogg_file)
+
+        try:
+            result = coder._convert_to_wav(ogg_file)
+            assert calls == [(ogg_file, result)]
+        finally:
+            coder.clear_converted_files()
+
+        with pytest.raises(UnsupportedInputFormatError) as exc_info:
+            coder._convert_to_wav("test.xyz")
+
+        assert ".ogg" in exc_info.value.supported
+        assert ".ogg" in str(exc_info.value)
 
     # def test_convert_to_wav_no_libraries(self) -> None:
     #     """Test _convert_to_wav with no conversion libraries"""
@@ -203,30 +503,71 @@ class TestAudioMultiFormatCoderConvertToWav:
 
     #     assert "Multi-format" in str(exc_info.value)
 
+    def test_scratch_frames_reuses_buffer(self) -> None:
+        """Test _scratch_frames only grows the read buffer when needed"""
+        coder = AudioMultiFormatCoder()
+
+        first = coder._scratch_frames(1000, 2)
+        buffer = coder._read_scratch
+        second = coder._scratch_frames(500, 1)
+
+        assert first.shape == (1000, 2)
+        assert second.shape == (500, 1)
+        assert coder._read_scratch is buffer
+
+        coder._scratch_frames(2000, 2)
+        assert coder._read_scratch.size == 4000
+
+    def test_stream_pcm16_bounds_block_size(self, tmp_path: Path) -> None:
+        """Test _stream_pcm16 copies in blocks no larger than STREAM_BLOCK_FRAMES"""
+        import soundfile as sf
+
+        coder = AudioMultiFormatCoder()
+        coder.STREAM_BLOCK_FRAMES = 1000
+        input_file = str(fixture_dir / "test_carrier.flac")
+        output_file = str(tmp_path / "output.wav")
+
+        frames = coder._stream_pcm16(input_file, output_file)
+
+        expected, _ = sf.read(input_file, dtype="int16")
+        actual, _ = sf.read(output_file, dtype="int16")
+        assert frames == len(expected)
+        assert np.array_equal(expected, actual)
+        assert coder._read_scratch.size <= 1000 * sf.info(input_file).channels
+
+    def test_convert_to_wav_flac_real_file(self) -> None:
+        """Test _convert_to_wav converts a real FLAC file to PCM_16 WAV"""
+        import soundfile as sf
+
+        coder = AudioMultiFormatCoder()
+        input_file = str(fixture_dir / "test_carrier.flac")
+
+        try:
+            result = coder._convert_to_wav(input_file)
+
+            info = sf.info(result)
+            assert info.subtype == "PCM_16"
+            assert info.frames == sf.info(input_file).frames
+        finally:
+            coder.clear_converted_files()
+
 
 class TestAudioMultiFormatCoderConvertFromWav:
     """Test suite for _convert_from_wav method"""
 
-    def test_convert_from_wav_to_wav(self) -> None:
+    def test_convert_from_wav_to_wav(self, tmp_path: Path) -> None:
         """Test _convert_from_wav WAV to WAV"""
         coder = AudioMultiFormatCoder()
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(b"test")
-            input_file = f.name
+        input_file = str(tmp_path / "input.wav")
+        Path(input_file).write_bytes(b"test")
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            output_file = f.name
+        output_file = str(tmp_path / "output.wav")
+        Path(output_file).touch()
 
-        try:
-            coder._convert_from_wav(input_file, output_file)
+        coder._convert_from_wav(input_file, output_file)
 
-            assert os.path.exists(output_file)
-        finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+        assert os.path.exists(output_file)
 
     def test_convert_from_wav_unsupported_format(self) -> None:
         """Test _convert_from_wav with unsupported output format"""
@@ -238,56 +579,78 @@ class TestAudioMultiFormatCoderConvertFromWav:
 
         assert "Unsupported output format" in str(exc_info.value)
 
-    def test_convert_from_wav_to_flac_soundfile(self) -> None:
+    def test_convert_from_wav_to_flac_soundfile(self, tmp_path: Path) -> None:
         """Test _convert_from_wav WAV to FLAC with soundfile"""
         coder = AudioMultiFormatCoder()
 
         input_file = str(fixture_dir / "test_encoded.wav")
-        output_file = tempfile.mktemp(suffix=".flac")
+        output_file = str(tmp_path / "output.flac")
 
-        try:
-            assert input_file
-            assert not os.path.exists(output_file)
+        assert input_file
+        assert not os.path.exists(output_file)
 
-            coder._convert_from_wav(str(input_file), output_file)
+        coder._convert_from_wav(str(input_file), output_file)
 
-            assert os.path.exists(output_file)
-            assert os.path.getsize(output_file) > 0
-            assert output_file.endswith(".flac")
-            with open(output_file, "rb") as f:
-                header = f.read(4)
-                assert header == b"fLaC"
-        finally:
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+        assert os.path.exists(output_file)
+        assert os.path.getsize(output_file) > 0
+        assert output_file.endswith(".flac")
+        with open(output_file, "rb") as f:
+            header = f.read(4)
+            assert header == b"fLaC"
+
+    @patch("ghostbit.audiostego.core.audio_multiformat_coder.AudioSegment")
+    @patch("ghostbit.audiostego.core.audio_multiformat_coder._SF_FORMATS", set())
+    def test_convert_from_wav_to_flac_without_soundfile_flac(
+        self, mock_audio_segment: MagicMock, tmp_path: Path
+    ) -> None:
+        """Test _convert_from_wav falls back to pydub when libsndfile lacks FLAC"""
+        coder = AudioMultiFormatCoder()
+        output_file = str(tmp_path / "output.flac")
+        mock_audio = mock_audio_segment.from_wav.return_value
+        mock_audio.export.side_effect = lambda path, **kwargs: Path(path).touch()
+
+        coder._convert_from_wav(str(fixture_dir / "test_encoded.wav"), output_file)
+
+        mock_audio.export.assert_called_once_with(output_file, format="flac")
+
+    def test_convert_from_wav_to_flac_preserves_samples(self, tmp_path: Path) -> None:
+        """Test _convert_from_wav FLAC output keeps the encoded samples bit-exact"""
+        import soundfile as sf
+
+        coder = AudioMultiFormatCoder()
+
+        input_file = str(fixture_dir / "test_encoded.wav")
+        output_file = str(tmp_path / "output.flac")
+
+        coder._convert_from_wav(input_file, output_file)
+
+        expected, _ = sf.read(input_file, dtype="int16")
+        actual, _ = sf.read(output_file, dtype="int16")
+        assert sf.info(output_file).subtype == "PCM_16"
+        assert np.array_equal(expected, actual)
 
-    def test_convert_from_wav_to_m4a_pydub(self) -> None:
+    def test_convert_from_wav_to_m4a_pydub(self, tmp_path: Path) -> None:
         """Test _convert_from_wav WAV to M4A with pydub"""
         coder = AudioMultiFormatCoder()
 
         input_file = str(fixture_dir / "test_carrier.wav")
-        output_file = tempfile.mktemp(suffix=".m4a")
+        output_file = str(tmp_path / "output.m4a")
 
-        try:
-            assert input_file
-            assert not os.path.exists(output_file)
-
-            coder._convert_from_wav(input_file, output_file)
+        assert input_file
+        assert not os.path.exists(output_file)
 
-            assert os.path.exists(output_file)
-            assert os.path.getsize(output_file) > 0
-            assert output_file.endswith(".m4a")
+        coder._convert_from_wav(input_file, output_file)
 
-            with open(output_file, "rb") as f:
-                data = f.read(12)
-                assert b"ftyp" in data, f"Expected ftyp in M4A header, got {data!r}"
-                assert (
-                    b"isom" in data or b"M4A" in data or b"mp42" in data
-                ), f"Expected M4A brand, got {data!r}"
+        assert os.path.exists(output_file)
+        assert os.path.getsize(output_file) > 0
+        assert output_file.endswith(".m4a")
 
-        finally:
-            if os.path.exists(output_file):
-                os.unlink(output_file)
+        with open(output_file, "rb") as f:
+            data = f.read(12)
+            assert b"ftyp" in data, f"Expected ftyp in M4A header, got {data!r}"
+            assert (
+                b"isom" in data or b"M4A" in data or b"mp42" in data
+            ), f"Expected M4A brand, got {data!r}"
 
 
 class TestAudioMultiFormatCoderEncodeFilesMultiFormat:
@@ -305,26 +668,22 @@ class TestAudioMultiFormatCoderEncodeFilesMultiFormat:
                     output_file="output.wav",
                 )
 
-    def test_encode_no_valid_secret_files(self) -> None:
+    def test_encode_no_valid_secret_files(self, tmp_path: Path) -> None:
         """Test encode with no valid secret files"""
         coder = AudioMultiFormatCoder()
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            carrier_file = f.name
+        carrier_file = str(tmp_path / "carrier.wav")
+        Path(carrier_file).touch()
 
-        try:
-            with patch.object(coder, "_convert_to_wav", return_value=carrier_file):
-                with pytest.raises(AudioMultiFormatCoderException) as exc_info:
-                    coder.encode_files_multi_format(
-                        carrier_file=carrier_file,
-                        secret_files=["/nonexistent1.txt", "/nonexistent2.txt"],
-                        output_file="output.wav",
-                    )
-
-                assert "No valid secret files" in str(exc_info.value)
-        finally:
-            if os.path.exists(carrier_file):
-                os.unlink(carrier_file)
+        with patch.object(coder, "_convert_to_wav", return_value=carrier_file):
+            with pytest.raises(AudioMultiFormatCoderException) as exc_info:
+                coder.encode_files_multi_format(
+                    carrier_file=carrier_file,
+                    secret_files=["/nonexistent1.txt", "/nonexistent2.txt"],
+                    output_file="output.wav",
+                )
+
+            assert "No valid secret files" in str(exc_info.value)
 
     @patch("os.path.getsize")
     @patch.object(AudioMultiFormatCoder, "encode_files_to_wav")
@@ -336,17 +695,16 @@ class TestAudioMultiFormatCoderEncodeFilesMultiFormat:
         mock_convert_from: MagicMock,
         mock_encode: MagicMock,
         mock_getsize: MagicMock,
+        tmp_path: Path,
     ) -> None:
         """Test encode sets encryption when password provided"""
         coder = AudioMultiFormatCoder()
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(b"0" * 100000)
-            carrier_file = f.name
+        carrier_file = str(tmp_path / "carrier.wav")
+        Path(carrier_file).write_bytes(b"0" * 100000)
 
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"secret")
-            secret_file = f.name
+        secret_file = str(tmp_path / "secret.txt")
+        Path(secret_file).write_bytes(b"secret")
 
         mock_convert_to.return_value = carrier_file
         mock_getsize.return_value = 1024 * 1024
@@ -361,8 +719,6 @@ class TestAudioMultiFormatCoderEncodeFilesMultiFormat:
 
             assert coder.encrypt
         finally:
-            os.unlink(carrier_file)
-            os.unlink(secret_file)
             coder.cleanup_temp_files()
 
     @patch("ghostbit.audiostego.core.audio_multiformat_coder.os.path.getsize")
@@ -375,17 +731,16 @@ class TestAudioMultiFormatCoderEncodeFilesMultiFormat:
         mock_convert_from: MagicMock,
         mock_encode: MagicMock,
         mock_getsize: MagicMock,
+        tmp_path: Path,
     ) -> None:
         """Test encode sets quality mode"""
         coder = AudioMultiFormatCoder()
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(b"0" * 100000)
-            carrier_file = f.name
+        carrier_file = str(tmp_path / "carrier.wav")
+        Path(carrier_file).write_bytes(b"0" * 100000)
 
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"secret")
-            secret_file = f.name
+        secret_file = str(tmp_path / "secret.txt")
+        Path(secret_file).write_bytes(b"secret")
 
         mock_convert_to.return_value = carrier_file
         mock_getsize.return_value = 5 * 1024 * 1024
@@ -417,10 +772,6 @@ class TestAudioMultiFormatCoderEncodeFilesMultiFormat:
             assert capacity_low / capacity_high == pytest.approx(4.0, rel=0.1)
 
         finally:
-            if os.path.exists(carrier_file):
-                os.unlink(carrier_file)
-            if os.path.exists(secret_file):
-                os.unlink(secret_file)
             coder.cleanup_temp_files()
 
 
@@ -440,13 +791,13 @@ class TestAudioMultiFormatCoderDecodeFilesMultiFormat:
     @patch.object(AudioMultiFormatCoder, "analyze_wav")
     @patch.object(AudioMultiFormatCoder, "_convert_to_wav")
     def test_decode_no_hidden_data(
-        self, mock_convert_to: MagicMock, mock_analyze: MagicMock
+        self, mock_convert_to: MagicMock, mock_analyze: MagicMock, tmp_path: Path
     ) -> None:
         """Test decode when no hidden data found"""
         coder = AudioMultiFormatCoder()
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        input_file = str(tmp_path / "input.wav")
+        Path(input_file).touch()
 
         mock_convert_to.return_value = input_file
 
@@ -463,8 +814,6 @@ class TestAudioMultiFormatCoderDecodeFilesMultiFormat:
                 )
 
         finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
             coder.cleanup_temp_files()
 
     @patch.object(AudioMultiFormatCoder, "decode_files_from_wav")
@@ -475,12 +824,13 @@ class TestAudioMultiFormatCoderDecodeFilesMultiFormat:
         mock_convert_to: MagicMock,
         mock_analyze: MagicMock,
         mock_decode: MagicMock,
+        tmp_path: Path,
     ) -> None:
         """Test decode with password"""
         coder = AudioMultiFormatCoder()
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        input_file = str(tmp_path / "input.wav")
+        Path(input_file).touch()
 
         mock_convert_to.return_value = input_file
 
@@ -499,8 +849,6 @@ class TestAudioMultiFormatCoderDecodeFilesMultiFormat:
 
                 assert coder.aes_key is not None
         finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
             coder.cleanup_temp_files()
 
 
@@ -510,13 +858,13 @@ class TestAudioMultiFormatCoderAnalyzeMultiFormat:
     @patch.object(AudioMultiFormatCoder, "analyze_wav")
     @patch.object(AudioMultiFormatCoder, "_convert_to_wav")
     def test_analyze_returns_true_when_data_found(
-        self, mock_convert_to: MagicMock, mock_analyze: MagicMock
+        self, mock_convert_to: MagicMock, mock_analyze: MagicMock, tmp_path: Path
     ) -> None:
         """Test analyze returns True when hidden data found"""
         coder = AudioMultiFormatCoder()
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        input_file = str(tmp_path / "input.wav")
+        Path(input_file).touch()
 
         mock_convert_to.return_value = input_file
 
@@ -531,20 +879,18 @@ class TestAudioMultiFormatCoderAnalyzeMultiFormat:
 
             assert result
         finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
             coder.cleanup_temp_files()
 
     @patch.object(AudioMultiFormatCoder, "analyze_wav")
     @patch.object(AudioMultiFormatCoder, "_convert_to_wav")
     def test_analyze_returns_false_when_no_data(
-        self, mock_convert_to: MagicMock, mock_analyze: MagicMock
+        self, mock_convert_to: MagicMock, mock_analyze: MagicMock, tmp_path: Path
     ) -> None:
         """Test analyze returns False when no hidden data"""
         coder = AudioMultiFormatCoder()
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        input_file = str(tmp_path / "input.wav")
+        Path(input_file).touch()
 
         mock_convert_to.return_value = input_file
 
@@ -559,20 +905,18 @@ class TestAudioMultiFormatCoderAnalyzeMultiFormat:
 
             assert not result
         finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
             coder.cleanup_temp_files()
 
     @patch.object(AudioMultiFormatCoder, "analyze_wav")
     @patch.object(AudioMultiFormatCoder, "_convert_to_wav")
     def test_analyze_with_password(
-        self, mock_convert_to: MagicMock, mock_analyze: MagicMock
+        self, mock_convert_to: MagicMock, mock_analyze: MagicMock, tmp_path: Path
     ) -> None:
         """Test analyze with password"""
         coder = AudioMultiFormatCoder()
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        input_file = str(tmp_path / "input.wav")
+        Path(input_file).touch()
 
         mock_convert_to.return_value = input_file
 
@@ -587,8 +931,6 @@ class TestAudioMultiFormatCoderAnalyzeMultiFormat:
 
             assert coder.aes_key is not None
         finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
             coder.cleanup_temp_files()
 
 
@@ -596,20 +938,20 @@ class TestAudioMultiFormatCoderAnalyzeMultiFormat:
 class TestAudioMultiFormatCoderIntegration:
     """Integration tests for AudioMultiFormatCoder"""
 
-    def test_temp_files_cleaned_after_operation(self) -> None:
+    def test_temp_files_cleaned_after_operation(self, tmp_path: Path) -> None:
         """Test temp files are cleaned up after operations"""
         coder = AudioMultiFormatCoder()
 
-        temp1 = tempfile.mktemp(suffix=".wav")
-        temp2 = tempfile.mktemp(suffix=".wav")
+        temp1 = str(tmp_path / "temp1.wav")
+        temp2 = str(tmp_path / "temp2.wav")
 
         with open(temp1, "w") as f:
             f.write("test1")
         with open(temp2, "w") as f:
             f.write("test2")
 
-        coder.temp_files.append(temp1)
-        coder.temp_files.append(temp2)
+        coder.temp_files.add(temp1)
+        coder.temp_files.add(temp2)
 
         assert os.path.exists(temp1)
         assert os.path.exists(temp2)
@@ -619,3 +961,40 @@ class TestAudioMultiFormatCoderIntegration:
         assert not os.path.exists(temp1)
         assert not os.path.exists(temp2)
         assert len(coder.temp_files) == 0
+
+    def test_encode_batch_encodes_each_job(self, tmp_path: Path) -> None:
+        """Test encode_batch encodes every job in worker processes"""
+        carrier_file = str(fixture_dir / "test_carrier.wav")
+        secret_file = str(fixture_dir / "test_secret_small.txt")
+
+        jobs = [
+            (carrier_file, [secret_file], str(tmp_path / f"out{i}.wav"))
+            for i in range(2)
+        ]
+
+        outputs = AudioMultiFormatCoder.encode_batch(jobs, max_workers=2)
+
+        assert outputs == [job[2] for job in jobs]
+        for output_file in outputs:
+            decoder = AudioMultiFormatCoder()
+            assert decoder.analyze_multi_format(output_file)
+            assert decoder.secret_files_info_items[0].file_size == (
+                os.path.getsize(secret_file)
+            )
+
+    def test_encode_batch_reraises_unsupported_format(self, tmp_path: Path) -> None:
+        """Test a bad job surfaces its typed error rather than breaking the pool"""
+        carrier_file = tmp_path / "carrier.ogg"
+        carrier_file.write_bytes(b"OggS")
+        secret_file = str(fixture_dir / "test_secret_small.txt")
+
+        jobs = [(str(carrier_file), [secret_file], str(tmp_path / "out.wav"))]
+
+        with pytest.raises(UnsupportedInputFormatError) as exc_info:
+            AudioMultiFormatCoder.encode_batch(jobs)
+
+        assert exc_info.value.ext == ".ogg"
+
+    def test_encode_batch_empty(self) -> None:
+        """Test encode_batch with no jobs returns an empty list"""
+        assert AudioMultiFormatCoder.encode_batch([]) == []
@@ -1,20 +1,142 @@
 #!/usr/bin/env python3
 import os
+import sys
 import pytest
-import tempfile
-from unittest.mock import MagicMock, patch
+import wave
+from pathlib import Path
+from typing import Callable, Optional
+from unittest.mock import MagicMock
+from pyfakefs.fake_filesystem import FakeFilesystem
+from pydub import AudioSegment
+from ghostbit.audiostego.cli import audiostego_cli as _cli_mod
 from ghostbit.audiostego.cli.audiostego_cli import AudioStegoCLI, main
+from ghostbit.audiostego.core.audio_multiformat_coder import AudioMultiFormatCoder
 from ghostbit.audiostego.core.audio_steganography import (
     EncodeMode,
     AudioSteganographyException,
     KeyEnterCanceledException,
     KeyRequiredEventArgs,
 )
+from _coder_stub import CoderStub
 
 """
 Tests for audiostego.cli.audiostego_cli module
 """
 
+# encode_command only checks that the carrier exists; the coder itself is mocked
+_CARRIER_BYTES = b""
+
+
+# (password, confirmation) replies for encode's double prompt
+_PW_MISMATCH = ("password1", "password2")
+_PW_MATCH = ("testpass", "testpass")
+
+
+def _answer_getpass(monkeypatch: pytest.MonkeyPatch, *replies: str) -> None:
+    """Make the CLI's getpass prompts return replies in order, repeating the last"""
+    pending, last = iter(replies), replies[-1]
+    monkeypatch.setattr(
+        _cli_mod.getpass, "getpass", lambda *args, **kwargs: next(pending, last)
+    )
+
+
+# (file_password, getpass reply, expected key, expected cancel) for request_key
+_KEY_CASES = [
+    ("testpass", None, "testpass", False),
+    (None, "prompted_pass", "prompted_pass", False),
+    (None, "", "", True),
+]
+
+
+# One coder-backed call per command, taking (cli, carrier, secret)
+_COMMANDS = [
+    pytest.param(
+        lambda cli, carrier, secret: cli.encode_command(
+            carrier, [secret], "out.wav", "normal"
+        ),
+        id="encode",
+    ),
+    pytest.param(
+        lambda cli, carrier, secret: cli.decode_command(carrier, "output"),
+        id="decode",
+    ),
+    pytest.param(
+        lambda cli, carrier, secret: cli.analyze_command(carrier),
+        id="analyze",
+    ),
+]
+
+
+def _run_key_callback(coder_stub: CoderStub) -> KeyRequiredEventArgs:
+    """Fire the request_key handler the command installed on the coder"""
+    assert coder_stub.on_key_required is not None
+    args = KeyRequiredEventArgs(h22_version="DSC2")
+    coder_stub.on_key_required(args)
+    return args
+
+
+@pytest.fixture(scope="session")
+def cli() -> AudioStegoCLI:
+    """AudioStegoCLI shared across the session; commands keep no state on it"""
+    return AudioStegoCLI()
+
+
+@pytest.fixture(scope="session")
+def cli_verbose() -> AudioStegoCLI:
+    """Verbose AudioStegoCLI shared across the session"""
+    return AudioStegoCLI(verbose=True)
+
+
+@pytest.fixture(scope="session")
+def carrier_and_secret(tmp_path_factory: pytest.TempPathFactory) -> tuple[str, str]:
+    """(carrier, secret) paths written once per session; commands only read them"""
+    d = tmp_path_factory.mktemp("stego")
+    (d / "carrier.wav").write_bytes(_CARRIER_BYTES)
+    (d / "secret.txt").write_bytes(b"secret")
+    return str(d / "carrier.wav"), str(d / "secret.txt")
+
+
+@pytest.fixture(scope="session")
+def input_wav(tmp_path_factory: pytest.TempPathFactory) -> str:
+    """Empty input path for decode/analyze tests, whose coder is mocked"""
+    path = tmp_path_factory.mktemp("stego") / "input.wav"
+    path.touch()
+    return str(path)
+
+
+@pytest.fixture
+def mock_coder(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Spec'd coder mock returned by every AudioMultiFormatCoder() in the CLI"""
+    coder = MagicMock(spec=AudioMultiFormatCoder)
+    monkeypatch.setattr(
+        _cli_mod, "AudioMultiFormatCoder", lambda *args, **kwargs: coder
+    )
+    return coder
+
+
+@pytest.fixture
+def mock_wave(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Spec'd stand-in for the CLI's wave module"""
+    mock = MagicMock(spec=wave)
+    monkeypatch.setattr(_cli_mod, "wave", mock)
+    return mock
+
+
+@pytest.fixture
+def mock_audio_segment(monkeypatch: pytest.MonkeyPatch) -> MagicMock:
+    """Spec'd stand-in for the CLI's AudioSegment class"""
+    mock = MagicMock(spec=AudioSegment)
+    monkeypatch.setattr(_cli_mod, "AudioSegment", mock)
+    return mock
+
+
+@pytest.fixture
+def coder_stub(monkeypatch: pytest.MonkeyPatch) -> CoderStub:
+    """Plain recording stub returned by every AudioMultiFormatCoder() in the CLI"""
+    stub = CoderStub()
+    monkeypatch.setattr(_cli_mod, "AudioMultiFormatCoder", lambda *args, **kwargs: stub)
+    return stub
+
 
 class TestAudioStegoCLIInitialization:
     """Test suite for AudioStegoCLI initialization"""
@@ -33,10 +155,25 @@ class TestAudioStegoCLIInitialization:
 class TestAudioStegoCLIEncodeCommand:
     """Test suite for encode_command method"""
 
-    def test_encode_missing_carrier_file(self) -> None:
-        """Test encode with missing carrier file returns error code"""
-        cli = AudioStegoCLI()
+    @pytest.fixture(autouse=True)
+    def fake_fs(self, fs: FakeFilesystem) -> FakeFilesystem:
+        """Serve this class's file I/O from pyfakefs"""
+        return fs
+
+    @pytest.fixture
+    def fake_carrier_and_secret(self, fs: FakeFilesystem) -> tuple[str, str]:
+        """(carrier, secret) paths on the fake filesystem"""
+        carrier = fs.create_file("/carrier.wav", contents=_CARRIER_BYTES)
+        secret = fs.create_file("/secret.txt", contents=b"secret")
+        return carrier.path, secret.path
 
+    @pytest.fixture
+    def empty_carrier(self, fs: FakeFilesystem) -> str:
+        """Zero-byte carrier path on the fake filesystem"""
+        return fs.create_file("/carrier.wav").path
+
+    def test_encode_missing_carrier_file(self, cli: AudioStegoCLI) -> None:
+        """Test encode with missing carrier file returns error code"""
         result = cli.encode_command(
             input_file="/nonexistent/carrier.wav",
             secret_files=["secret.txt"],
@@ -46,494 +183,347 @@ class TestAudioStegoCLIEncodeCommand:
 
         assert result == 1
 
-    def test_encode_missing_secret_files(self) -> None:
+    def test_encode_missing_secret_files(
+        self, empty_carrier: str, cli: AudioStegoCLI
+    ) -> None:
         """Test encode with missing secret files returns error code"""
-        cli = AudioStegoCLI()
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            carrier_file = f.name
-
-        try:
-            result = cli.encode_command(
-                input_file=carrier_file,
-                secret_files=["/nonexistent1.txt", "/nonexistent2.txt"],
-                output_file="output.wav",
-                audio_quality="normal",
-            )
+        result = cli.encode_command(
+            input_file=empty_carrier,
+            secret_files=["/nonexistent1.txt", "/nonexistent2.txt"],
+            output_file="output.wav",
+            audio_quality="normal",
+        )
 
-            assert result == 1
-        finally:
-            if os.path.exists(carrier_file):
-                os.unlink(carrier_file)
+        assert result == 1
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.getpass.getpass")
-    def test_encode_password_prompt_mismatch(self, mock_getpass: MagicMock) -> None:
+    def test_encode_password_prompt_mismatch(
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fake_carrier_and_secret: tuple[str, str],
+        cli: AudioStegoCLI,
+    ) -> None:
         """Test encode with password prompt that doesn't match"""
-        cli = AudioStegoCLI()
+        _answer_getpass(monkeypatch, *_PW_MISMATCH)
 
-        mock_getpass.side_effect = ["password1", "password2"]
+        carrier_file, secret_file = fake_carrier_and_secret
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            carrier_file = f.name
-
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            secret_file = f.name
-
-        try:
-            result = cli.encode_command(
-                input_file=carrier_file,
-                secret_files=[secret_file],
-                output_file="output.wav",
-                audio_quality="normal",
-                file_password="prompt",
-            )
+        result = cli.encode_command(
+            input_file=carrier_file,
+            secret_files=[secret_file],
+            output_file="output.wav",
+            audio_quality="normal",
+            file_password="prompt",
+        )
 
-            assert result == 1
-        finally:
-            if os.path.exists(carrier_file):
-                os.unlink(carrier_file)
-            if os.path.exists(secret_file):
-                os.unlink(secret_file)
+        assert result == 1
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.getpass.getpass")
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
     def test_encode_password_prompt_match(
-        self, mock_coder_class: MagicMock, mock_getpass: MagicMock
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fake_carrier_and_secret: tuple[str, str],
+        cli: AudioStegoCLI,
+        mock_coder: MagicMock,
     ) -> None:
         """Test encode with matching password prompt"""
-        cli = AudioStegoCLI()
+        _answer_getpass(monkeypatch, *_PW_MATCH)
 
-        mock_getpass.side_effect = ["testpass", "testpass"]
-
-        mock_coder = MagicMock()
-        mock_coder_class.return_value = mock_coder
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(b"0" * 100000)
-            carrier_file = f.name
-
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"secret")
-            secret_file = f.name
-
-        try:
-            cli.encode_command(
-                input_file=carrier_file,
-                secret_files=[secret_file],
-                output_file="output.wav",
-                audio_quality="normal",
-                file_password="prompt",
-            )
-
-            mock_coder.encode_files_multi_format.assert_called_once()
-            call_kwargs = mock_coder.encode_files_multi_format.call_args[1]
-            assert call_kwargs["password"] == "testpass"
-        finally:
-            if os.path.exists(carrier_file):
-                os.unlink(carrier_file)
-            if os.path.exists(secret_file):
-                os.unlink(secret_file)
-
-    def test_encode_quality_modes(self) -> None:
-        """Test encode with different quality modes"""
-        cli = AudioStegoCLI()
+        carrier_file, secret_file = fake_carrier_and_secret
 
-        with patch(
-            "ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder"
-        ) as mock_coder_class:
-            mock_coder = MagicMock()
-            mock_coder_class.return_value = mock_coder
-
-            with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-                f.write(b"0" * 100000)
-                carrier_file = f.name
-
-            with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-                f.write(b"secret")
-                secret_file = f.name
-
-            try:
-                cli.encode_command(carrier_file, [secret_file], "out.wav", "low")
-                call_kwargs = mock_coder.encode_files_multi_format.call_args[1]
-                assert call_kwargs["quality_mode"] == EncodeMode.LOW_QUALITY
-
-                cli.encode_command(carrier_file, [secret_file], "out.wav", "normal")
-                call_kwargs = mock_coder.encode_files_multi_format.call_args[1]
-                assert call_kwargs["quality_mode"] == EncodeMode.NORMAL_QUALITY
-
-                cli.encode_command(carrier_file, [secret_file], "out.wav", "high")
-                call_kwargs = mock_coder.encode_files_multi_format.call_args[1]
-                assert call_kwargs["quality_mode"] == EncodeMode.HIGH_QUALITY
-            finally:
-                if os.path.exists(carrier_file):
-                    os.unlink(carrier_file)
-                if os.path.exists(secret_file):
-                    os.unlink(secret_file)
-
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_encode_with_progress_callback(self, mock_coder_class: MagicMock) -> None:
-        """Test encode sets up progress callback when verbose"""
-        cli = AudioStegoCLI(verbose=True)
+        cli.encode_command(
+            input_file=carrier_file,
+            secret_files=[secret_file],
+            output_file="output.wav",
+            audio_quality="normal",
+            file_password="prompt",
+        )
 
-        mock_coder = MagicMock()
-        mock_coder_class.return_value = mock_coder
+        mock_coder.encode_files_multi_format.assert_called_once()
+        call_kwargs = mock_coder.encode_files_multi_format.call_args[1]
+        assert call_kwargs["password"] == "testpass"
+
+    @pytest.mark.parametrize(
+        "mode_str,mode_enum",
+        [
+            ("low", EncodeMode.LOW_QUALITY),
+            ("normal", EncodeMode.NORMAL_QUALITY),
+            ("high", EncodeMode.HIGH_QUALITY),
+        ],
+    )
+    def test_encode_quality_mode(
+        self,
+        mode_str: str,
+        mode_enum: EncodeMode,
+        fake_carrier_and_secret: tuple[str, str],
+        cli: AudioStegoCLI,
+        mock_coder: MagicMock,
+    ) -> None:
+        """Test encode maps each quality string to its EncodeMode"""
+        carrier_file, secret_file = fake_carrier_and_secret
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(b"0" * 100000)
-            carrier_file = f.name
+        cli.encode_command(carrier_file, [secret_file], "out.wav", mode_str)
 
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"secret")
-            secret_file = f.name
+        call_kwargs = mock_coder.encode_files_multi_format.call_args[1]
+        assert call_kwargs["quality_mode"] == mode_enum
 
-        try:
-            cli.encode_command(carrier_file, [secret_file], "out.wav", "normal")
+    def test_encode_with_progress_callback(
+        self,
+        fake_carrier_and_secret: tuple[str, str],
+        cli_verbose: AudioStegoCLI,
+        mock_coder: MagicMock,
+    ) -> None:
+        """Test encode sets up progress callback when verbose"""
+        carrier_file, secret_file = fake_carrier_and_secret
 
-            assert mock_coder.on_encoded_element is not None
-        finally:
-            if os.path.exists(carrier_file):
-                os.unlink(carrier_file)
-            if os.path.exists(secret_file):
-                os.unlink(secret_file)
+        cli_verbose.encode_command(carrier_file, [secret_file], "out.wav", "normal")
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_encode_steganography_exception(self, mock_coder_class: MagicMock) -> None:
-        """Test encode handles AudioSteganographyException"""
-        cli = AudioStegoCLI()
+        assert mock_coder.on_encoded_element is not None
 
-        mock_coder = MagicMock()
+    def test_encode_steganography_exception(
+        self,
+        fake_carrier_and_secret: tuple[str, str],
+        cli: AudioStegoCLI,
+        mock_coder: MagicMock,
+    ) -> None:
+        """Test encode handles AudioSteganographyException"""
         mock_coder.encode_files_multi_format.side_effect = AudioSteganographyException(
             "Test error"
         )
-        mock_coder_class.return_value = mock_coder
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(b"0" * 100000)
-            carrier_file = f.name
+        carrier_file, secret_file = fake_carrier_and_secret
 
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"secret")
-            secret_file = f.name
+        result = cli.encode_command(carrier_file, [secret_file], "out.wav", "normal")
 
-        try:
-            result = cli.encode_command(
-                carrier_file, [secret_file], "out.wav", "normal"
-            )
-
-            assert result == 1
-        finally:
-            if os.path.exists(carrier_file):
-                os.unlink(carrier_file)
-            if os.path.exists(secret_file):
-                os.unlink(secret_file)
+        assert result == 1
 
 
 class TestAudioStegoCLIDecodeCommand:
     """Test suite for decode_command method"""
 
-    def test_decode_missing_input_file(self) -> None:
-        """Test decode with missing input file returns error code"""
-        cli = AudioStegoCLI()
+    @pytest.fixture(autouse=True)
+    def fake_fs(self, fs: FakeFilesystem) -> FakeFilesystem:
+        """Serve this class's file I/O from pyfakefs"""
+        return fs
 
+    def test_decode_missing_input_file(self, cli: AudioStegoCLI) -> None:
+        """Test decode with missing input file returns error code"""
         result = cli.decode_command(
             input_file="/nonexistent/file.wav", output_dir="output"
         )
 
         assert result == 1
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.getpass.getpass")
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
     def test_decode_with_password_prompt(
-        self, mock_coder_class: MagicMock, mock_getpass: MagicMock
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fs: FakeFilesystem,
+        cli: AudioStegoCLI,
+        mock_coder: MagicMock,
     ) -> None:
         """Test decode with password prompt"""
-        cli = AudioStegoCLI()
-
-        mock_getpass.return_value = "testpass"
-
-        mock_coder = MagicMock()
-        mock_coder_class.return_value = mock_coder
+        _answer_getpass(monkeypatch, "testpass")
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        input_file = fs.create_file("/input.wav").path
 
-        try:
-            cli.decode_command(
-                input_file=input_file, output_dir="output", file_password="prompt"
-            )
+        cli.decode_command(
+            input_file=input_file, output_dir="output", file_password="prompt"
+        )
 
-            mock_coder.decode_files_multi_format.assert_called_once()
-        finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
+        mock_coder.decode_files_multi_format.assert_called_once()
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_decode_with_direct_password(self, mock_coder_class: MagicMock) -> None:
+    def test_decode_with_direct_password(
+        self, fs: FakeFilesystem, cli: AudioStegoCLI, mock_coder: MagicMock
+    ) -> None:
         """Test decode with direct password"""
-        cli = AudioStegoCLI()
-
-        mock_coder = MagicMock()
-        mock_coder_class.return_value = mock_coder
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        input_file = fs.create_file("/input.wav").path
 
-        try:
-            cli.decode_command(
-                input_file=input_file, output_dir="output", file_password="testpass"
-            )
+        cli.decode_command(
+            input_file=input_file, output_dir="output", file_password="testpass"
+        )
 
-            call_kwargs = mock_coder.decode_files_multi_format.call_args[1]
-            assert call_kwargs["password"] == "testpass"
-        finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
+        call_kwargs = mock_coder.decode_files_multi_format.call_args[1]
+        assert call_kwargs["password"] == "testpass"
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_decode_with_progress_callback(self, mock_coder_class: MagicMock) -> None:
+    def test_decode_with_progress_callback(
+        self, fs: FakeFilesystem, cli_verbose: AudioStegoCLI, mock_coder: MagicMock
+    ) -> None:
         """Test decode sets up progress callback when verbose"""
-        cli = AudioStegoCLI(verbose=True)
-
-        mock_coder = MagicMock()
-        mock_coder_class.return_value = mock_coder
+        input_file = fs.create_file("/input.wav").path
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        cli_verbose.decode_command(input_file, "output")
 
-        try:
-            cli.decode_command(input_file, "output")
+        assert mock_coder.on_decoded_element is not None
 
-            assert mock_coder.on_decoded_element is not None
-        finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
-
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_decode_key_cancelled(self, mock_coder_class: MagicMock) -> None:
+    def test_decode_key_cancelled(
+        self, fs: FakeFilesystem, cli: AudioStegoCLI, mock_coder: MagicMock
+    ) -> None:
         """Test decode handles KeyEnterCanceledException"""
-        cli = AudioStegoCLI()
-
-        mock_coder = MagicMock()
         mock_coder.decode_files_multi_format.side_effect = KeyEnterCanceledException()
-        mock_coder_class.return_value = mock_coder
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        input_file = fs.create_file("/input.wav").path
 
-        try:
-            result = cli.decode_command(input_file, "output")
+        result = cli.decode_command(input_file, "output")
 
-            assert result == 1
-        finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
+        assert result == 1
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_decode_steganography_exception(self, mock_coder_class: MagicMock) -> None:
+    def test_decode_steganography_exception(
+        self, fs: FakeFilesystem, cli: AudioStegoCLI, mock_coder: MagicMock
+    ) -> None:
         """Test decode handles AudioSteganographyException"""
-        cli = AudioStegoCLI()
-
-        mock_coder = MagicMock()
         mock_coder.decode_files_multi_format.side_effect = AudioSteganographyException(
             "Test error"
         )
-        mock_coder_class.return_value = mock_coder
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        input_file = fs.create_file("/input.wav").path
 
-        try:
-            result = cli.decode_command(input_file, "output")
+        result = cli.decode_command(input_file, "output")
 
-            assert result == 1
-        finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
+        assert result == 1
 
 
 class TestAudioStegoCLIAnalyzeCommand:
     """Test suite for analyze_command method"""
 
-    def test_analyze_missing_input_file(self) -> None:
-        """Test analyze with missing input file returns error code"""
-        cli = AudioStegoCLI()
+    @pytest.fixture(autouse=True)
+    def fake_fs(self, fs: FakeFilesystem) -> FakeFilesystem:
+        """Serve this class's file I/O from pyfakefs"""
+        return fs
 
+    def test_analyze_missing_input_file(self, cli: AudioStegoCLI) -> None:
+        """Test analyze with missing input file returns error code"""
         result = cli.analyze_command(input_file="/nonexistent/file.wav")
 
         assert result == 1
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_analyze_found_data(self, mock_coder_class: MagicMock) -> None:
+    def test_analyze_found_data(
+        self, fs: FakeFilesystem, cli: AudioStegoCLI, mock_coder: MagicMock
+    ) -> None:
         """Test analyze when hidden data is found"""
-        cli = AudioStegoCLI()
-
-        mock_coder = MagicMock()
         mock_coder.analyze_multi_format.return_value = True
-        mock_coder_class.return_value = mock_coder
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        input_file = fs.create_file("/input.wav").path
 
-        try:
-            result = cli.analyze_command(input_file)
+        result = cli.analyze_command(input_file)
 
-            assert result == 0
-        finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
+        assert result == 0
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_analyze_no_data_found(self, mock_coder_class: MagicMock) -> None:
+    def test_analyze_no_data_found(
+        self, fs: FakeFilesystem, cli: AudioStegoCLI, mock_coder: MagicMock
+    ) -> None:
         """Test analyze when no hidden data is found"""
-        cli = AudioStegoCLI()
-
-        mock_coder = MagicMock()
         mock_coder.analyze_multi_format.return_value = False
-        mock_coder_class.return_value = mock_coder
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        input_file = fs.create_file("/input.wav").path
 
-        try:
-            result = cli.analyze_command(input_file)
+        result = cli.analyze_command(input_file)
 
-            assert result == 1
-        finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
+        assert result == 1
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.getpass.getpass")
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
     def test_analyze_with_password_prompt(
-        self, mock_coder_class: MagicMock, mock_getpass: MagicMock
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        fs: FakeFilesystem,
+        cli: AudioStegoCLI,
+        mock_coder: MagicMock,
     ) -> None:
         """Test analyze with password prompt"""
-        cli = AudioStegoCLI()
+        _answer_getpass(monkeypatch, "testpass")
 
-        mock_getpass.return_value = "testpass"
-
-        mock_coder = MagicMock()
         mock_coder.analyze_multi_format.return_value = True
-        mock_coder_class.return_value = mock_coder
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
-
-        try:
-            cli.analyze_command(input_file, file_password="prompt")
-            mock_coder.analyze_multi_format.assert_called_once()
-            call_args = mock_coder.analyze_multi_format.call_args
-            if call_args[1]:
-                assert call_args[1]["password"] == "testpass"
-            else:
-                assert call_args[0][1] == "testpass"
-        finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
-
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_analyze_key_cancelled(self, mock_coder_class: MagicMock) -> None:
-        """Test analyze handles KeyEnterCanceledException"""
-        cli = AudioStegoCLI()
 
-        mock_coder = MagicMock()
+        input_file = fs.create_file("/input.wav").path
+
+        cli.analyze_command(input_file, file_password="prompt")
+        mock_coder.analyze_multi_format.assert_called_once()
+        call_args = mock_coder.analyze_multi_format.call_args
+        if call_args[1]:
+            assert call_args[1]["password"] == "testpass"
+        else:
+            assert call_args[0][1] == "testpass"
+
+    def test_analyze_key_cancelled(
+        self, fs: FakeFilesystem, cli: AudioStegoCLI, mock_coder: MagicMock
+    ) -> None:
+        """Test analyze handles KeyEnterCanceledException"""
         mock_coder.analyze_multi_format.side_effect = KeyEnterCanceledException()
-        mock_coder_class.return_value = mock_coder
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        input_file = fs.create_file("/input.wav").path
 
-        try:
-            result = cli.analyze_command(input_file)
+        result = cli.analyze_command(input_file)
 
-            assert result == 1
-        finally:
-            if os.path.exists(input_file):
-                os.unlink(input_file)
+        assert result == 1
 
 
 class TestAudioStegoCLICreateTestFilesCommand:
     """Test suite for create_test_files_command method"""
 
-    def test_create_test_files_basic(self) -> None:
-        """Test create test files without carrier"""
-        cli = AudioStegoCLI()
+    @pytest.fixture(autouse=True)
+    def _in_tmp_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Run from tmp_path so the command's relative output/ lands there"""
+        monkeypatch.chdir(tmp_path)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = cli.create_test_files_command(
-                output_dir=tmpdir
-            )
+    def test_create_test_files_basic(self, cli: AudioStegoCLI) -> None:
+        """Test create test files without carrier"""
+        result = cli.create_test_files_command(output_dir="testcases")
 
-            assert result == 0
+        assert result == 0
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.wave")
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioSegment")
+    @pytest.mark.slow
     def test_create_test_files_with_carrier(
-        self, mock_audio_segment: MagicMock, mock_wave: MagicMock
+        self,
+        mock_audio_segment: MagicMock,
+        mock_wave: MagicMock,
+        cli: AudioStegoCLI,
     ) -> None:
         """Test create test files with carrier"""
-        cli = AudioStegoCLI()
-
-        mock_wav = MagicMock()
+        mock_wav = MagicMock(spec_set=wave.Wave_write)
         mock_wave.open.return_value.__enter__.return_value = mock_wav
 
-        mock_sound = MagicMock()
+        mock_sound = MagicMock(spec_set=AudioSegment)
         mock_audio_segment.from_wav.return_value = mock_sound
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = cli.create_test_files_command(
-                output_dir=tmpdir
-            )
+        result = cli.create_test_files_command(output_dir="testcases")
 
-            assert result == 0
+        assert result == 0
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.wave")
-    def test_create_test_files_carrier_exception(self, mock_wave: MagicMock) -> None:
+    def test_create_test_files_carrier_exception(
+        self, mock_wave: MagicMock, cli: AudioStegoCLI
+    ) -> None:
         """Test create test files handles carrier creation exception"""
-        cli = AudioStegoCLI()
-
         mock_wave.open.side_effect = Exception("Test error")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = cli.create_test_files_command(
-                output_dir=tmpdir
-            )
+        result = cli.create_test_files_command(output_dir="testcases")
 
-            assert result == 0
+        assert result == 0
 
 
 class TestMainFunction:
     """Test suite for main() function"""
 
-    @patch("sys.argv", ["ghostbit audio"])
-    def test_main_no_command(self) -> None:
-        """Test main with no command exits with error"""
-        with pytest.raises(SystemExit) as exc_info:
-            main()
-
-        assert exc_info.value.code == 1
-
-    @patch("sys.argv", ["ghostbit audio", "--version"])
-    def test_main_version(self) -> None:
-        """Test main with --version flag"""
-        with pytest.raises(SystemExit) as exc_info:
-            main()
-
-        assert exc_info.value.code == 0
+    @pytest.mark.parametrize(
+        "argv,code",
+        [
+            (["ghostbit audio"], 1),
+            (["ghostbit audio", "--version"], 0),
+            (["audiostego", "--help"], 0),
+        ],
+        ids=["no_command", "version", "help"],
+    )
+    def test_main_exit_codes(
+        self, monkeypatch: pytest.MonkeyPatch, argv: list[str], code: int
+    ) -> None:
+        """Test main exits with the expected code for no command, --version, --help"""
+        monkeypatch.setattr(sys, "argv", argv)
 
-    @patch("sys.argv", ["audiostego", "--help"])
-    def test_main_help(self) -> None:
-        """Test main with --help flag"""
         with pytest.raises(SystemExit) as exc_info:
             main()
 
-        assert exc_info.value.code == 0
+        assert exc_info.value.code == code
 
-    @patch("sys.argv", ["audiostego", "info"])
-    @patch.object(AudioStegoCLI, "info_command")
-    def test_main_info_command(self, mock_info: MagicMock) -> None:
+    def test_main_info_command(self, monkeypatch: pytest.MonkeyPatch) -> None:
         """Test main executes info command"""
-        mock_info.return_value = 0
+        monkeypatch.setattr(sys, "argv", ["audiostego", "info"])
+        mock_info = MagicMock(return_value=0)
+        monkeypatch.setattr(AudioStegoCLI, "info_command", mock_info)
 
         result = main()
 
@@ -542,595 +532,273 @@ class TestMainFunction:
 
 
 @pytest.mark.integration
+@pytest.mark.slow
 class TestAudioStegoCLIIntegration:
     """Integration tests for AudioStegoCLI"""
 
-    def test_end_to_end_info_command(self) -> None:
+    def test_end_to_end_info_command(self, cli: AudioStegoCLI) -> None:
         """Test info command end-to-end"""
-        cli = AudioStegoCLI()
-
         result = cli.info_command()
 
         assert result == 0
 
-    def test_encode_creates_output_directory(self) -> None:
+    def test_encode_creates_output_directory(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch, cli: AudioStegoCLI
+    ) -> None:
         """Test encode creates output directory"""
-        cli = AudioStegoCLI()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            carrier_file = os.path.join(tmpdir, "carrier.wav")
-            secret_file = os.path.join(tmpdir, "secret.txt")
-
-            with open(carrier_file, "wb") as f:
-                f.write(b"0" * 100000)
-
-            with open(secret_file, "wb") as f:
-                f.write(b"secret data")
-
-            cli.encode_command(carrier_file, [secret_file], "output.wav", "normal")
+        monkeypatch.chdir(tmp_path)
+        carrier_file = tmp_path / "carrier.wav"
+        secret_file = tmp_path / "secret.txt"
+        carrier_file.write_bytes(_CARRIER_BYTES)
+        secret_file.write_bytes(b"secret data")
+
+        cli.encode_command(
+            str(carrier_file), [str(secret_file)], "output.wav", "normal"
+        )
 
-            assert os.path.exists("output")
+        assert (tmp_path / "output").exists()
 
 
 class TestEncodeCommandCallbacks:
     """Test encode_command nested callbacks"""
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
     def test_encode_on_progress_callback_execution(
-        self, mock_coder_class: MagicMock
+        self,
+        carrier_and_secret: tuple[str, str],
+        cli_verbose: AudioStegoCLI,
+        mock_coder: MagicMock,
     ) -> None:
         """Test that on_progress callback is actually called during encoding"""
-        cli = AudioStegoCLI(verbose=True)
+        carrier_file, secret_file = carrier_and_secret
 
-        mock_coder = MagicMock()
-        mock_coder_class.return_value = mock_coder
+        cli_verbose.encode_command(carrier_file, [secret_file], "out.wav", "normal")
 
-        captured_callback = None
+        mock_coder.on_encoded_element()
 
-        def get_callback(self):
-            return None
-
-        def capture_callback(self, value):
-            nonlocal captured_callback
-            captured_callback = value
-
-        type(mock_coder).on_encoded_element = property(get_callback, capture_callback)
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(b"0" * 100000)
-            carrier_file = f.name
-
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"secret")
-            secret_file = f.name
-
-        try:
-            cli.encode_command(carrier_file, [secret_file], "out.wav", "normal")
-
-            if captured_callback:
-                for i in range(250):
-                    captured_callback()
-
-                assert True
-        finally:
-            os.unlink(carrier_file)
-            os.unlink(secret_file)
-
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    @patch("builtins.print")
     def test_encode_progress_prints_every_100_blocks(
-        self, mock_print: MagicMock, mock_coder_class: MagicMock
+        self,
+        capsys: pytest.CaptureFixture[str],
+        carrier_and_secret: tuple[str, str],
+        cli_verbose: AudioStegoCLI,
+        mock_coder: MagicMock,
     ) -> None:
         """Test on_progress prints every 100 blocks"""
-        cli = AudioStegoCLI(verbose=True)
-
-        mock_coder = MagicMock()
-        mock_coder_class.return_value = mock_coder
-
-        callback = None
-
-        def get_callback(self):
-            return callback
-
-        def set_callback(self, cb):
-            nonlocal callback
-            callback = cb
-
-        type(mock_coder).on_key_required = property(get_callback, set_callback)
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(b"0" * 100000)
-            carrier_file = f.name
-
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"secret")
-            secret_file = f.name
-
-        try:
-            cli.encode_command(carrier_file, [secret_file], "out.wav", "normal")
+        carrier_file, secret_file = carrier_and_secret
 
-            if callback:
-                mock_print.reset_mock()
+        cli_verbose.encode_command(carrier_file, [secret_file], "out.wav", "normal")
+        capsys.readouterr()
 
-                for _ in range(100):
-                    callback()
+        cb = mock_coder.on_encoded_element
+        for _ in range(100):
+            cb()
 
-                progress_calls = [
-                    c
-                    for c in mock_print.call_args_list
-                    if len(c[0]) > 0 and "Processed" in str(c[0][0])
-                ]
-                assert len(progress_calls) >= 1
-        finally:
-            os.unlink(carrier_file)
-            os.unlink(secret_file)
+        assert capsys.readouterr().out.count("Processed") == 1
 
 
 class TestDecodeCommandCallbacks:
     """Test decode_command nested callbacks"""
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_decode_request_key_callback_with_password(
-        self, mock_coder_class: MagicMock
-    ) -> None:
-        """Test request_key callback when password is provided"""
-        cli = AudioStegoCLI()
-
-        mock_coder = MagicMock()
-        mock_coder_class.return_value = mock_coder
-
-        callback = None
-
-        def get_callback(self):
-            return callback
-
-        def set_callback(self, cb):
-            nonlocal callback
-            callback = cb
-
-        type(mock_coder).on_key_required = property(get_callback, set_callback)
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
-
-        try:
-            cli.decode_command(input_file, "output", file_password="testpass")
-
-            if callback:
-                args = KeyRequiredEventArgs(h22_version="DSC2")
-                callback(args)
-
-                assert args.key == "testpass"
-                assert not args.cancel
-        finally:
-            os.unlink(input_file)
-
-    @patch("ghostbit.audiostego.cli.audiostego_cli.getpass.getpass")
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_decode_request_key_callback_prompt_with_key(
-        self, mock_coder_class: MagicMock, mock_getpass: MagicMock
-    ) -> None:
-        """Test request_key callback prompts for password"""
-        cli = AudioStegoCLI()
-
-        mock_getpass.return_value = "prompted_pass"
-
-        mock_coder = MagicMock()
-        mock_coder_class.return_value = mock_coder
-
-        callback = None
-
-        def get_callback(self):
-            return callback
-
-        def set_callback(self, cb):
-            nonlocal callback
-            callback = cb
-
-        type(mock_coder).on_key_required = property(get_callback, set_callback)
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
-
-        try:
-            cli.decode_command(input_file, "output", file_password=None)
-
-            if callback:
-                args = KeyRequiredEventArgs(h22_version="DSC2")
-                callback(args)
-
-                assert args.key == "prompted_pass"
-                assert not args.cancel
-        finally:
-            os.unlink(input_file)
-
-    @patch("ghostbit.audiostego.cli.audiostego_cli.getpass.getpass")
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_decode_request_key_callback_cancelled(
-        self, mock_coder_class: MagicMock, mock_getpass: MagicMock
+    @pytest.mark.parametrize(
+        "file_password,getpass_reply,expected_key,expected_cancel", _KEY_CASES
+    )
+    def test_decode_request_key_callback(
+        self,
+        file_password: Optional[str],
+        getpass_reply: Optional[str],
+        expected_key: str,
+        expected_cancel: bool,
+        monkeypatch: pytest.MonkeyPatch,
+        input_wav: str,
+        cli: AudioStegoCLI,
+        coder_stub: CoderStub,
     ) -> None:
-        """Test request_key callback when user cancels"""
-        cli = AudioStegoCLI()
-
-        mock_getpass.return_value = ""
-
-        mock_coder = MagicMock()
-        mock_coder_class.return_value = mock_coder
-
-        callback = None
-
-        def get_callback(self):
-            return callback
-
-        def set_callback(self, cb):
-            nonlocal callback
-            callback = cb
-
-        type(mock_coder).on_key_required = property(get_callback, set_callback)
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
-
-        try:
-            cli.decode_command(input_file, "output")
+        """Test request_key callback with a given, prompted or cancelled password"""
+        if getpass_reply is not None:
+            _answer_getpass(monkeypatch, getpass_reply)
 
-            if callback:
-                args = KeyRequiredEventArgs(h22_version="DSC2")
-                callback(args)
+        cli.decode_command(input_wav, "output", file_password=file_password)
+        args = _run_key_callback(coder_stub)
 
-                assert args.cancel
-        finally:
-            os.unlink(input_file)
+        assert args.key == expected_key
+        assert args.cancel is expected_cancel
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    @patch("builtins.print")
     def test_decode_on_progress_callback_execution(
-        self, mock_print: MagicMock, mock_coder_class: MagicMock
+        self,
+        capsys: pytest.CaptureFixture[str],
+        input_wav: str,
+        cli_verbose: AudioStegoCLI,
+        mock_coder: MagicMock,
     ) -> None:
         """Test decode on_progress callback is executed"""
-        cli = AudioStegoCLI(verbose=True)
-
-        mock_coder = MagicMock()
-        mock_coder_class.return_value = mock_coder
-
-        progress_callback = None
-
-        def get_progress_callback(self):
-            return progress_callback
-
-        def set_progress_callback(self, cb):
-            nonlocal progress_callback
-            progress_callback = cb
-
-        # Set up on_decoded_element property (not on_key_required)
-        type(mock_coder).on_decoded_element = property(
-            get_progress_callback, set_progress_callback
-        )
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
-
-        try:
-            cli.decode_command(input_file, "output")
+        cli_verbose.decode_command(input_wav, "output")
+        capsys.readouterr()
 
-            if progress_callback:
-                mock_print.reset_mock()
+        # One past the 100-block print threshold; takes no arguments
+        cb = mock_coder.on_decoded_element
+        for _ in range(101):
+            cb()
 
-                for _ in range(150):
-                    progress_callback()  # This callback takes no arguments
-
-                progress_calls = [
-                    c
-                    for c in mock_print.call_args_list
-                    if len(c[0]) > 0 and "Processed" in str(c[0][0])
-                ]
-                assert len(progress_calls) >= 1
-        finally:
-            os.unlink(input_file)
+        assert capsys.readouterr().out.count("Processed") == 1
 
 
 class TestAnalyzeCommandCallbacks:
     """Test analyze_command nested callbacks"""
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_analyze_request_key_with_password(
-        self, mock_coder_class: MagicMock
+    @pytest.mark.parametrize(
+        "file_password,getpass_reply,expected_key,expected_cancel", _KEY_CASES
+    )
+    def test_analyze_request_key_callback(
+        self,
+        file_password: Optional[str],
+        getpass_reply: Optional[str],
+        expected_key: str,
+        expected_cancel: bool,
+        monkeypatch: pytest.MonkeyPatch,
+        input_wav: str,
+        cli: AudioStegoCLI,
+        coder_stub: CoderStub,
     ) -> None:
-        """Test analyze request_key callback with password"""
-        cli = AudioStegoCLI()
-
-        mock_coder = MagicMock()
-        mock_coder.analyze_multi_format.return_value = True
-        mock_coder_class.return_value = mock_coder
-
-        callback = None
-
-        def get_callback(self):
-            return callback
-
-        def set_callback(self, cb):
-            nonlocal callback
-            callback = cb
-
-        type(mock_coder).on_key_required = property(get_callback, set_callback)
+        """Test analyze request_key with a given, prompted or skipped password"""
+        if getpass_reply is not None:
+            _answer_getpass(monkeypatch, getpass_reply)
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+        cli.analyze_command(input_wav, file_password=file_password)
+        args = _run_key_callback(coder_stub)
 
-        try:
-            cli.analyze_command(input_file, file_password="testpass")
-
-            if callback:
-                args = KeyRequiredEventArgs(h22_version="DSC2")
-                callback(args)
-
-                assert args.key == "testpass"
-                assert not args.cancel
-        finally:
-            os.unlink(input_file)
-
-    @patch("ghostbit.audiostego.cli.audiostego_cli.getpass.getpass")
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_analyze_request_key_prompt_with_key(
-        self, mock_coder_class: MagicMock, mock_getpass: MagicMock
-    ) -> None:
-        """Test analyze request_key prompts for password"""
-        cli = AudioStegoCLI()
-
-        mock_getpass.return_value = "prompted_pass"
-
-        mock_coder = MagicMock()
-        mock_coder.analyze_multi_format.return_value = True
-        mock_coder_class.return_value = mock_coder
-
-        callback = None
-
-        def get_callback(self):
-            return callback
-
-        def set_callback(self, cb):
-            nonlocal callback
-            callback = cb
-
-        type(mock_coder).on_key_required = property(get_callback, set_callback)
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
-
-        try:
-            cli.analyze_command(input_file)
-
-            if callback:
-                args = KeyRequiredEventArgs(h22_version="DSC2")
-                callback(args)
-
-                assert args.key == "prompted_pass"
-                assert not args.cancel
-        finally:
-            os.unlink(input_file)
-
-    @patch("ghostbit.audiostego.cli.audiostego_cli.getpass.getpass")
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_analyze_request_key_cancelled(
-        self, mock_coder_class: MagicMock, mock_getpass: MagicMock
-    ) -> None:
-        """Test analyze request_key when user cancels"""
-        cli = AudioStegoCLI()
-
-        mock_getpass.return_value = ""
-
-        mock_coder = MagicMock()
-        mock_coder.analyze_multi_format.return_value = True
-        mock_coder_class.return_value = mock_coder
-
-        callback = None
-
-        def get_callback(self):
-            return callback
-
-        def set_callback(self, cb):
-            nonlocal callback
-            callback = cb
-
-        type(mock_coder).on_key_required = property(get_callback, set_callback)
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
-
-        try:
-            cli.analyze_command(input_file)
-
-            if callback:
-                args = KeyRequiredEventArgs(h22_version="DSC2")
-                callback(args)
-
-                assert args.cancel
-        finally:
-            os.unlink(input_file)
+        assert args.key == expected_key
+        assert args.cancel is expected_cancel
 
 
 class TestCreateTestFilesCommand:
     """Test create_test_files_command"""
 
-    def test_create_test_files_with_carrier_full_workflow(self) -> None:
-        """Test complete carrier creation workflow"""
-        cli = AudioStegoCLI()
+    @pytest.fixture(autouse=True)
+    def _in_tmp_path(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        """Run from tmp_path so the command's relative output/ lands there"""
+        monkeypatch.chdir(tmp_path)
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = cli.create_test_files_command(tmpdir)
+    def test_create_test_files_with_carrier_full_workflow(
+        self, cli: AudioStegoCLI, tmp_path: Path
+    ) -> None:
+        """Test complete carrier creation workflow"""
+        result = cli.create_test_files_command("testcases")
 
-            assert result == 0
+        assert result == 0
 
-            output_path = os.path.join("output", tmpdir)
+        output_path = os.path.join(tmp_path, "output", "testcases")
 
-            assert os.path.exists(os.path.join(output_path, "test_secret.txt"))
-            assert os.path.exists(os.path.join(output_path, "test_document.txt"))
+        assert os.path.exists(os.path.join(output_path, "test_secret.txt"))
+        assert os.path.exists(os.path.join(output_path, "test_document.txt"))
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioSegment")
-    @patch("ghostbit.audiostego.cli.audiostego_cli.wave")
     def test_create_test_files_carrier_partial_failure(
-        self, mock_wave: MagicMock, mock_audio_segment: MagicMock
+        self,
+        mock_wave: MagicMock,
+        mock_audio_segment: MagicMock,
+        cli: AudioStegoCLI,
     ) -> None:
         """Test when AudioSegment conversion fails"""
-        cli = AudioStegoCLI()
-
-        mock_wav = MagicMock()
+        mock_wav = MagicMock(spec_set=wave.Wave_write)
         mock_wave.open.return_value.__enter__.return_value = mock_wav
         mock_audio_segment.from_wav.side_effect = Exception("Conversion error")
 
-        with tempfile.TemporaryDirectory() as tmpdir:
-            result = cli.create_test_files_command(tmpdir)
+        result = cli.create_test_files_command("testcases")
 
-            assert result == 0
+        assert result == 0
 
-    def test_create_test_files_output_directory_created(self) -> None:
+    def test_create_test_files_output_directory_created(
+        self, cli: AudioStegoCLI, tmp_path: Path
+    ) -> None:
         """Test that output directory is created"""
-        cli = AudioStegoCLI()
-
-        with tempfile.TemporaryDirectory() as tmpdir:
-            test_dir = os.path.join(tmpdir, "testcases")
-            result = cli.create_test_files_command(test_dir)
-            output_path = os.path.join("output", test_dir)
+        result = cli.create_test_files_command("testcases")
+        output_path = os.path.join(tmp_path, "output", "testcases")
 
-            assert os.path.exists(output_path)
-            assert os.path.exists(os.path.join(output_path, "test_secret.txt"))
-            assert os.path.exists(os.path.join(output_path, "test_document.txt"))
+        assert os.path.exists(output_path)
+        assert os.path.exists(os.path.join(output_path, "test_secret.txt"))
+        assert os.path.exists(os.path.join(output_path, "test_document.txt"))
 
-            assert result == 0
+        assert result == 0
 
 
 class TestEncodeCommandEdgeCases:
     """Additional encode_command edge cases"""
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_encode_with_direct_password(self, mock_coder_class: MagicMock) -> None:
+    def test_encode_with_direct_password(
+        self,
+        carrier_and_secret: tuple[str, str],
+        cli: AudioStegoCLI,
+        coder_stub: CoderStub,
+    ) -> None:
         """Test encode with direct password (not prompt)"""
-        cli = AudioStegoCLI()
-
-        mock_coder = MagicMock()
-        mock_coder_class.return_value = mock_coder
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(b"0" * 100000)
-            carrier_file = f.name
-
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"secret")
-            secret_file = f.name
-
-        try:
-            cli.encode_command(
-                carrier_file,
-                [secret_file],
-                "out.wav",
-                "normal",
-                file_password="mypassword",
-            )
-
-            call_kwargs = mock_coder.encode_files_multi_format.call_args[1]
-            assert call_kwargs["password"] == "mypassword"
-        finally:
-            os.unlink(carrier_file)
-            os.unlink(secret_file)
-
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_encode_exception_with_verbose(self, mock_coder_class: MagicMock) -> None:
-        """Test encode exception prints traceback in verbose mode"""
-        cli = AudioStegoCLI(verbose=True)
-
-        mock_coder = MagicMock()
-        mock_coder.encode_files_multi_format.side_effect = Exception("Unexpected error")
-        mock_coder_class.return_value = mock_coder
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            f.write(b"0" * 100000)
-            carrier_file = f.name
-
-        with tempfile.NamedTemporaryFile(suffix=".txt", delete=False) as f:
-            f.write(b"secret")
-            secret_file = f.name
-
-        try:
-            with patch("traceback.print_exc") as mock_traceback:
-                result = cli.encode_command(
-                    carrier_file, [secret_file], "out.wav", "normal"
-                )
-                mock_traceback.assert_called_once()
-                assert result == 1
-        finally:
-            os.unlink(carrier_file)
-            os.unlink(secret_file)
-
-
-class TestDecodeCommandEdgeCases:
-    """Additional decode_command edge cases"""
-
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_decode_exception_with_verbose(self, mock_coder_class: MagicMock) -> None:
-        """Test decode exception prints traceback in verbose mode"""
-        cli = AudioStegoCLI(verbose=True)
-
-        mock_coder = MagicMock()
-        mock_coder.decode_files_multi_format.side_effect = Exception("Unexpected error")
-        mock_coder_class.return_value = mock_coder
-
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
-
-        try:
-            with patch("traceback.print_exc") as mock_traceback:
-                result = cli.decode_command(input_file, "output")
+        carrier_file, secret_file = carrier_and_secret
+
+        cli.encode_command(
+            carrier_file,
+            [secret_file],
+            "out.wav",
+            "normal",
+            file_password="mypassword",
+        )
 
-                mock_traceback.assert_called_once()
-                assert result == 1
-        finally:
-            os.unlink(input_file)
+        assert coder_stub.calls["encode"]["password"] == "mypassword"
 
 
 class TestAnalyzeCommandEdgeCases:
     """Additional analyze_command edge cases"""
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.getpass.getpass")
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
     def test_analyze_password_prompt_empty(
-        self, mock_coder_class: MagicMock, mock_getpass: MagicMock
+        self,
+        monkeypatch: pytest.MonkeyPatch,
+        input_wav: str,
+        cli: AudioStegoCLI,
+        coder_stub: CoderStub,
     ) -> None:
         """Test analyze with password prompt returns empty (skipped)"""
-        cli = AudioStegoCLI()
+        _answer_getpass(monkeypatch, "")
 
-        mock_getpass.return_value = ""
+        cli.analyze_command(input_wav, file_password="prompt")
+        assert coder_stub.calls["analyze"]["password"] is None
 
-        mock_coder = MagicMock()
-        mock_coder.analyze_multi_format.return_value = True
-        mock_coder_class.return_value = mock_coder
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+class TestCommandExceptionWithVerbose:
+    """Unexpected coder errors print a traceback in verbose mode"""
+
+    @pytest.mark.parametrize("run", _COMMANDS)
+    def test_exception_with_verbose(
+        self,
+        run: Callable[[AudioStegoCLI, str, str], int],
+        carrier_and_secret: tuple[str, str],
+        cli_verbose: AudioStegoCLI,
+        coder_stub: CoderStub,
+        capsys: pytest.CaptureFixture[str],
+    ) -> None:
+        """Test command exception prints traceback in verbose mode"""
+        coder_stub.raises = Exception("Unexpected error")
 
-        try:
-            cli.analyze_command(input_file, file_password="prompt")
-            call_kwargs = mock_coder.analyze_multi_format.call_args[1]
-            assert call_kwargs.get("password") is None
-        finally:
-            os.unlink(input_file)
+        carrier_file, secret_file = carrier_and_secret
 
-    @patch("ghostbit.audiostego.cli.audiostego_cli.AudioMultiFormatCoder")
-    def test_analyze_exception_with_verbose(self, mock_coder_class: MagicMock) -> None:
-        """Test analyze exception prints traceback in verbose mode"""
-        cli = AudioStegoCLI(verbose=True)
+        result = run(cli_verbose, carrier_file, secret_file)
+
+        assert result == 1
+        err = capsys.readouterr().err
+        assert err.count("Traceback") == 1
+        assert "Exception: Unexpected error" in err
 
-        mock_coder = MagicMock()
-        mock_coder.analyze_multi_format.side_effect = Exception("Unexpected error")
-        mock_coder_class.return_value = mock_coder
 
-        with tempfile.NamedTemporaryFile(suffix=".wav", delete=False) as f:
-            input_file = f.name
+class TestCommandTempScope:
+    """Commands release the coder's temp and converted WAVs when they finish"""
+
+    @pytest.mark.parametrize("run", _COMMANDS)
+    def test_command_runs_inside_temp_scope(
+        self,
+        run: Callable[[AudioStegoCLI, str, str], int],
+        carrier_and_secret: tuple[str, str],
+        cli: AudioStegoCLI,
+        mock_coder: MagicMock,
+    ) -> None:
+        """Test each command enters and exits coder.temp_scope()"""
+        carrier_file, secret_file = carrier_and_secret
 
-        try:
-            with patch("traceback.print_exc") as mock_traceback:
-                result = cli.analyze_command(input_file)
+        run(cli, carrier_file, secret_file)
 
-                mock_traceback.assert_called_once()
-                assert result == 1
-        finally:
-            os.unlink(input_file)
+        mock_coder.temp_scope.assert_called_once_with()
+        mock_coder.temp_scope.return_value.__exit__.assert_called_once()
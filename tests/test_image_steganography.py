@@ -1,11 +1,9 @@
 #!/usr/bin/env python3
-import os
 import pytest
 import secrets
 import struct
 from PIL import Image
 from typing import List
-import tempfile
 
 from ghostbit.imagestego.core.image_steganography import (
     Algorithm,
@@ -339,22 +337,18 @@ class TestLSBStego:
         assert stego_img.size == (100, 100)
         assert stego_img.mode == "RGBA"
 
-    def test_encode_decode_roundtrip(self, lsb_stego, test_image):
+    def test_encode_decode_roundtrip(self, lsb_stego, test_image, tmp_path):
         """Test encode-decode roundtrip"""
         original_data = b"Secret message" * 10
         
         stego_img = lsb_stego.encode(test_image, original_data)
         
         # Save and reload to test persistence
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            stego_img.save(tmp.name)
-            tmp_path = tmp.name
+        stego_path = tmp_path / "stego.png"
+        stego_img.save(stego_path)
         
-        try:
-            decoded_data = lsb_stego.decode(tmp_path, len(original_data))
-            assert decoded_data == original_data
-        finally:
-            os.unlink(tmp_path)
+        decoded_data = lsb_stego.decode(str(stego_path), len(original_data))
+        assert decoded_data == original_data
 
     def test_encode_maximum_capacity(self, lsb_stego, test_image):
         """Test encoding at maximum capacity"""
@@ -364,21 +358,17 @@ class TestLSBStego:
         stego_img = lsb_stego.encode(test_image, data)
         assert isinstance(stego_img, Image.Image)
 
-    def test_decode_correct_length(self, lsb_stego, test_image):
+    def test_decode_correct_length(self, lsb_stego, test_image, tmp_path):
         """Test decoding with correct data length"""
         data = b"Test data for decoding"
         
         stego_img = lsb_stego.encode(test_image, data)
         
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            stego_img.save(tmp.name)
-            tmp_path = tmp.name
+        stego_path = tmp_path / "stego.png"
+        stego_img.save(stego_path)
         
-        try:
-            decoded = lsb_stego.decode(tmp_path, len(data))
-            assert decoded == data
-        finally:
-            os.unlink(tmp_path)
+        decoded = lsb_stego.decode(str(stego_path), len(data))
+        assert decoded == data
 
     def test_encode_seq(self, lsb_stego, test_image):
         """Test sequential encoding"""
@@ -389,21 +379,17 @@ class TestLSBStego:
         assert isinstance(stego_img, Image.Image)
         assert stego_img.mode == "RGBA"
 
-    def test_decode_seq(self, lsb_stego, test_image):
+    def test_decode_seq(self, lsb_stego, test_image, tmp_path):
         """Test sequential decoding"""
         data = b"Sequential test"
         
         stego_img = lsb_stego.encode_seq(test_image, data)
         
-        with tempfile.NamedTemporaryFile(suffix=".png", delete=False) as tmp:
-            stego_img.save(tmp.name)
-            tmp_path = tmp.name
+        stego_path = tmp_path / "stego.png"
+        stego_img.save(stego_path)
         
-        try:
-            decoded = lsb_stego.decode_seq(tmp_path, len(data))
-            assert decoded == data
-        finally:
-            os.unlink(tmp_path)
+        decoded = lsb_stego.decode_seq(str(stego_path), len(data))
+        assert decoded == data
 
     def test_encode_preserves_image_size(self, lsb_stego, test_image):
         """Test that encoding preserves image dimensions"""
@@ -19,6 +19,12 @@ Tests for imagestego.cli.imagestego_cli module
 """
 
 
+@pytest.fixture(autouse=True)
+def _in_tmp_path(tmp_path, monkeypatch):
+    """Run from tmp_path so the CLI's relative output/ lands there"""
+    monkeypatch.chdir(tmp_path)
+
+
 class TestImageStegoCLIInit:
     """Test ImageStegoCLI initialization"""
 
@@ -1,6 +1,8 @@
 #!/usr/bin/env python3
+import os
 import pytest
 from pathlib import Path
+from typing import Optional
 import ghostbit.audiostego.skills as audio_skills_module
 from ghostbit.audiostego.skills import (
     AudioSkill,
@@ -21,16 +23,8 @@ from ghostbit.imagestego.skills import (
     IMAGE_SKILLS_DIR,
 )
 
-
-
-class TestAudioSkill:
-    """Test suite for Skill class"""
-
-    @pytest.fixture
-    def sample_skill_content(self) -> str:
-        """Sample skill markdown content"""
-        # No leading whitespace!
-        return """# Test Skill
+# Sample skill markdown content; no leading whitespace!
+_SAMPLE_SKILL_CONTENT = """# Test Skill
 
 This is a test skill for unit testing.
 
@@ -74,24 +68,81 @@ console.log("test");
 ````
 """
 
-    @pytest.fixture
-    def temp_skill_dir(self, tmp_path: Path, sample_skill_content: str) -> Path:
-        """Create a temporary skill directory"""
-        skill_dir = tmp_path / "test_skill"
-        skill_dir.mkdir()
-        skill_file = skill_dir / "SKILL.md"
-        skill_file.write_text(sample_skill_content)
-        return skill_dir
+# skill1/skill2 are valid, invalid has no SKILL.md and _hidden is skipped by name
+_LOADER_LAYOUT: dict[str, Optional[str]] = {
+    "skill1": "# Skill 1\n\nFirst skill",
+    "skill2": "# Skill 2\n\nSecond skill",
+    "invalid": None,
+    "_hidden": "# Hidden\n\nHidden skill",
+}
 
-    def test_skill_initialization(
-        self, temp_skill_dir: Path, sample_skill_content: str
-    ) -> None:
+
+# Skills that only exercise construction; none has a "## " section
+_EDGE_LAYOUT: dict[str, Optional[str]] = {
+    "empty_skill": "",
+    "skill-with-dashes": "# Skill With Dashes\n\nContent",
+    "unicode_skill": "# 技能\n\n日本語コンテンツ 🎵",
+    "no_sections_skill": "# Title\n\nJust content, no sections",
+}
+
+# (name, expected title, expected description); an untitled skill uses its name
+_EDGE_CASES = [
+    ("empty_skill", "empty_skill", ""),
+    ("skill-with-dashes", "Skill With Dashes", "Content"),
+    ("unicode_skill", "技能", "日本語コンテンツ 🎵"),
+    ("no_sections_skill", "Title", "Just content, no sections"),
+]
+
+
+def _build_skills(root: Path, layout: dict[str, Optional[str]]) -> Path:
+    """Create a directory per entry under root, with SKILL.md unless content is None"""
+    for name, content in layout.items():
+        skill_dir = root / name
+        skill_dir.mkdir(exist_ok=True)
+        if content is not None:
+            (skill_dir / "SKILL.md").write_text(content)
+    return root
+
+
+@pytest.fixture(scope="session")
+def temp_skills_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Skills directory for the loader tests, built once per session"""
+    return _build_skills(tmp_path_factory.mktemp("skills"), _LOADER_LAYOUT)
+
+
+@pytest.fixture(scope="session")
+def edge_skills_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Skills directory for the edge-case tests, built once per session"""
+    return _build_skills(tmp_path_factory.mktemp("edge_skills"), _EDGE_LAYOUT)
+
+
+@pytest.fixture(scope="session")
+def temp_skill_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Single sample skill directory, built once per session; tests only read it"""
+    skill_dir = tmp_path_factory.mktemp("skill") / "test_skill"
+    skill_dir.mkdir()
+    (skill_dir / "SKILL.md").write_text(_SAMPLE_SKILL_CONTENT)
+    return skill_dir
+
+
+@pytest.fixture(scope="session")
+def shared_skills_dir(tmp_path_factory: pytest.TempPathFactory) -> Path:
+    """Skills directory for the module-function tests, built once per session"""
+    return _build_skills(
+        tmp_path_factory.mktemp("skills"), {"test_skill": "# Test\n\nTest skill"}
+    )
+
+
+class TestAudioSkill:
+    """Test suite for Skill class"""
+
+    def test_skill_initialization(self, temp_skill_dir: Path) -> None:
         """Test AudioSkill object initialization"""
         skill = AudioSkill("test_skill", temp_skill_dir)
 
         assert skill.name == "test_skill"
         assert skill.path == temp_skill_dir
-        assert skill.content == sample_skill_content
+        assert skill.content == _SAMPLE_SKILL_CONTENT
         assert skill.title == "Test Skill"
         assert "test skill for unit testing" in skill.description.lower()
 
@@ -191,6 +242,20 @@ console.log("test");
         assert examples[0]["language"] == "python"
         assert examples[0]["code"] == "code without language"
 
+    def test_parsed_results_are_cached_copies(self, temp_skill_dir: Path) -> None:
+        """Test repeated lookups reuse the parse but callers get their own copies"""
+        skill = AudioSkill("test_skill", temp_skill_dir)
+
+        assert skill.get_section("Usage") is skill.get_section("Usage")
+
+        sections = skill.get_all_sections()
+        sections.clear()
+        assert "Overview" in skill.get_all_sections()
+
+        examples = skill.get_examples()
+        examples[0]["code"] = "changed"
+        assert skill.get_examples()[0]["code"] != "changed"
+
     def test_skill_str_representation(self, temp_skill_dir: Path) -> None:
         """Test string representation of AudioSkill"""
         skill = AudioSkill("test_skill", temp_skill_dir)
@@ -203,29 +268,6 @@ console.log("test");
 class TestAudioSkillLoader:
     """Test suite for AudioSkillLoader class"""
 
-    @pytest.fixture
-    def temp_skills_dir(self, tmp_path: Path) -> Path:
-        """Create temporary skills directory with multiple skills"""
-        skills_dir = tmp_path / "skills"
-        skills_dir.mkdir()
-
-        skill1_dir = skills_dir / "skill1"
-        skill1_dir.mkdir()
-        (skill1_dir / "SKILL.md").write_text("# Skill 1\n\nFirst skill")
-
-        skill2_dir = skills_dir / "skill2"
-        skill2_dir.mkdir()
-        (skill2_dir / "SKILL.md").write_text("# Skill 2\n\nSecond skill")
-
-        invalid_dir = skills_dir / "invalid"
-        invalid_dir.mkdir()
-
-        hidden_dir = skills_dir / "_hidden"
-        hidden_dir.mkdir()
-        (hidden_dir / "SKILL.md").write_text("# Hidden\n\nHidden skill")
-
-        return skills_dir
-
     @pytest.fixture
     def skill_loader(self, temp_skills_dir: Path, monkeypatch) -> AudioSkillLoader:
         """Create AudioSkillLoader with temp directory"""
@@ -269,10 +311,11 @@ class TestAudioSkillLoader:
         assert "skill1" in str(exc_info.value)
 
     def test_load_audio_skill_missing_skill_file(
-        self, skill_loader: AudioSkillLoader, tmp_path: Path
+        self, skill_loader: AudioSkillLoader, tmp_path: Path, monkeypatch
     ) -> None:
         """Test loading a skill directory without SKILL.md"""
-        invalid_dir = skill_loader.skills_dir / "no_skill_md"
+        monkeypatch.setattr(skill_loader, "skills_dir", tmp_path)
+        invalid_dir = tmp_path / "no_skill_md"
         invalid_dir.mkdir()
 
         with pytest.raises(ValueError) as exc_info:
@@ -280,6 +323,26 @@ class TestAudioSkillLoader:
 
         assert "SKILL.md not found" in str(exc_info.value)
 
+    def test_load_audio_skill_cached_until_modified(
+        self, skill_loader: AudioSkillLoader, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Test load_skill reuses the parsed skill until SKILL.md changes"""
+        monkeypatch.setattr(skill_loader, "skills_dir", tmp_path)
+        skill_file = tmp_path / "cached" / "SKILL.md"
+        skill_file.parent.mkdir()
+        skill_file.write_text("# Before\n\nOriginal")
+
+        first = skill_loader.load_skill("cached")
+        assert skill_loader.load_skill("cached") is first
+
+        skill_file.write_text("# After\n\nEdited")
+        mtime_ns = skill_file.stat().st_mtime_ns
+        os.utime(skill_file, ns=(mtime_ns, mtime_ns + 1_000_000))
+
+        reloaded = skill_loader.load_skill("cached")
+        assert reloaded is not first
+        assert reloaded.title == "After"
+
     def test_get_all_audio_skills(self, skill_loader: AudioSkillLoader) -> None:
         """Test getting all skills"""
         skills = skill_loader.get_all_skills()
@@ -331,17 +394,10 @@ class TestAudioModuleFunctions:
     """Test suite for module-level convenience functions"""
 
     @pytest.fixture
-    def temp_skills_dir(self, tmp_path: Path, monkeypatch) -> Path:
-        """Create temporary skills directory"""
-        skills_dir = tmp_path / "skills"
-        skills_dir.mkdir()
-
-        skill_dir = skills_dir / "test_skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("# Test\n\nTest skill")
-
-        monkeypatch.setattr(audio_skills_module, "AUDIO_SKILLS_DIR", skills_dir)
-        return skills_dir
+    def temp_skills_dir(self, shared_skills_dir: Path, monkeypatch) -> Path:
+        """Point the module's skills directory at the shared one"""
+        monkeypatch.setattr(audio_skills_module, "AUDIO_SKILLS_DIR", shared_skills_dir)
+        return shared_skills_dir
 
     def test_load_audio_skill_function(self, temp_skills_dir: Path) -> None:
         """Test module-level load_skill function"""
@@ -413,16 +469,18 @@ class TestAudioSkillsIntegration:
 class TestAudioEdgeCases:
     """Test edge cases and error conditions"""
 
-    def test_skill_with_empty_content(self, tmp_path: Path) -> None:
-        """Test skill with empty SKILL.md"""
-        skill_dir = tmp_path / "empty_skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("")
+    @pytest.mark.parametrize("name,title,description", _EDGE_CASES)
+    def test_minimal_skill(
+        self, edge_skills_dir: Path, name: str, title: str, description: str
+    ) -> None:
+        """Test empty, dashed-name, unicode and section-less skills"""
+        skill = AudioSkill(name, edge_skills_dir / name)
 
-        skill = AudioSkill("empty_skill", skill_dir)
-        assert skill.content == ""
-        assert skill.title == "empty_skill"
-        assert skill.description == ""
+        assert skill.name == name
+        assert skill.content == _EDGE_LAYOUT[name]
+        assert skill.title == title
+        assert skill.description == description
+        assert skill.get_all_sections() == {}
 
     def test_skill_with_only_code_blocks(self, tmp_path: Path) -> None:
         """Test skill with only code blocks"""
@@ -535,108 +593,17 @@ Different content here.
         assert "pip install" in install or "```bash" in install
         assert "That's all" in install
 
-    def test_get_all_sections_empty_skill(self, tmp_path: Path) -> None:
-        """Test getting all sections from skill without sections"""
-        skill_dir = tmp_path / "no_sections_skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("# Title\n\nJust content, no sections")
-
-        skill = AudioSkill("no_sections_skill", skill_dir)
-        sections = skill.get_all_sections()
-        assert isinstance(sections, dict)
-        assert len(sections) == 0
-
-    def test_special_characters_in_skill_name(self, tmp_path: Path) -> None:
-        """Test skill with special characters in directory name"""
-        skill_dir = tmp_path / "skill-with-dashes"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("# Skill With Dashes\n\nContent")
-
-        skill = AudioSkill("skill-with-dashes", skill_dir)
-        assert skill.name == "skill-with-dashes"
-        assert skill.title == "Skill With Dashes"
-
-    def test_unicode_in_skill_content(self, tmp_path: Path) -> None:
-        """Test skill with unicode characters"""
-        skill_dir = tmp_path / "unicode_skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("# 技能\n\n日本語コンテンツ 🎵")
-
-        skill = AudioSkill("unicode_skill", skill_dir)
-        assert "技能" in skill.title
-        assert "日本語" in skill.content
-        assert "🎵" in skill.content
-
 
 class TestImageSkill:
     """Test suite for Skill class"""
 
-    @pytest.fixture
-    def sample_skill_content(self) -> str:
-        """Sample skill markdown content"""
-        # No leading whitespace!
-        return """# Test Skill
-
-This is a test skill for unit testing.
-
-## Overview
-
-This section contains an overview of the skill.
-
-## Installation
-
-Install the required packages:
-````bash
-pip install test-package
-````
-
-## Usage
-
-Here's how to use this skill:
-````python
-def example():
-    print("Hello, World!")
-````
-
-## Advanced Features
-
-### Subsection 1
-
-Some advanced content here.
-
-### Subsection 2
-
-More advanced content.
-
-## Examples
-````python
-# Example 1
-result = do_something()
-````
-````javascript
-// Example 2
-console.log("test");
-````
-"""
-
-    @pytest.fixture
-    def temp_skill_dir(self, tmp_path: Path, sample_skill_content: str) -> Path:
-        """Create a temporary skill directory"""
-        skill_dir = tmp_path / "test_skill"
-        skill_dir.mkdir()
-        skill_file = skill_dir / "SKILL.md"
-        skill_file.write_text(sample_skill_content)
-        return skill_dir
-
-    def test_skill_initialization(
-        self, temp_skill_dir: Path, sample_skill_content: str
-    ) -> None:
+    def test_skill_initialization(self, temp_skill_dir: Path) -> None:
         """Test ImageSkill object initialization"""
         skill = ImageSkill("test_skill", temp_skill_dir)
 
         assert skill.name == "test_skill"
         assert skill.path == temp_skill_dir
-        assert skill.content == sample_skill_content
+        assert skill.content == _SAMPLE_SKILL_CONTENT
         assert skill.title == "Test Skill"
         assert "test skill for unit testing" in skill.description.lower()
 
@@ -736,6 +703,20 @@ console.log("test");
         assert examples[0]["language"] == "python"
         assert examples[0]["code"] == "code without language"
 
+    def test_parsed_results_are_cached_copies(self, temp_skill_dir: Path) -> None:
+        """Test repeated lookups reuse the parse but callers get their own copies"""
+        skill = ImageSkill("test_skill", temp_skill_dir)
+
+        assert skill.get_section("Usage") is skill.get_section("Usage")
+
+        sections = skill.get_all_sections()
+        sections.clear()
+        assert "Overview" in skill.get_all_sections()
+
+        examples = skill.get_examples()
+        examples[0]["code"] = "changed"
+        assert skill.get_examples()[0]["code"] != "changed"
+
     def test_skill_str_representation(self, temp_skill_dir: Path) -> None:
         """Test string representation of ImageSkill"""
         skill = ImageSkill("test_skill", temp_skill_dir)
@@ -748,29 +729,6 @@ console.log("test");
 class TestImageSkillLoader:
     """Test suite for ImageSkillLoader class"""
 
-    @pytest.fixture
-    def temp_skills_dir(self, tmp_path: Path) -> Path:
-        """Create temporary skills directory with multiple skills"""
-        skills_dir = tmp_path / "skills"
-        skills_dir.mkdir()
-
-        skill1_dir = skills_dir / "skill1"
-        skill1_dir.mkdir()
-        (skill1_dir / "SKILL.md").write_text("# Skill 1\n\nFirst skill")
-
-        skill2_dir = skills_dir / "skill2"
-        skill2_dir.mkdir()
-        (skill2_dir / "SKILL.md").write_text("# Skill 2\n\nSecond skill")
-
-        invalid_dir = skills_dir / "invalid"
-        invalid_dir.mkdir()
-
-        hidden_dir = skills_dir / "_hidden"
-        hidden_dir.mkdir()
-        (hidden_dir / "SKILL.md").write_text("# Hidden\n\nHidden skill")
-
-        return skills_dir
-
     @pytest.fixture
     def skill_loader(self, temp_skills_dir: Path, monkeypatch) -> ImageSkillLoader:
         """Create ImageSkillLoader with temp directory"""
@@ -814,10 +772,11 @@ class TestImageSkillLoader:
         assert "skill1" in str(exc_info.value)
 
     def test_load_image_skill_missing_skill_file(
-        self, skill_loader: ImageSkillLoader, tmp_path: Path
+        self, skill_loader: ImageSkillLoader, tmp_path: Path, monkeypatch
     ) -> None:
         """Test loading a skill directory without SKILL.md"""
-        invalid_dir = skill_loader.skills_dir / "no_skill_md"
+        monkeypatch.setattr(skill_loader, "skills_dir", tmp_path)
+        invalid_dir = tmp_path / "no_skill_md"
         invalid_dir.mkdir()
 
         with pytest.raises(ValueError) as exc_info:
@@ -825,6 +784,26 @@ class TestImageSkillLoader:
 
         assert "SKILL.md not found" in str(exc_info.value)
 
+    def test_load_image_skill_cached_until_modified(
+        self, skill_loader: ImageSkillLoader, tmp_path: Path, monkeypatch
+    ) -> None:
+        """Test load_skill reuses the parsed skill until SKILL.md changes"""
+        monkeypatch.setattr(skill_loader, "skills_dir", tmp_path)
+        skill_file = tmp_path / "cached" / "SKILL.md"
+        skill_file.parent.mkdir()
+        skill_file.write_text("# Before\n\nOriginal")
+
+        first = skill_loader.load_skill("cached")
+        assert skill_loader.load_skill("cached") is first
+
+        skill_file.write_text("# After\n\nEdited")
+        mtime_ns = skill_file.stat().st_mtime_ns
+        os.utime(skill_file, ns=(mtime_ns, mtime_ns + 1_000_000))
+
+        reloaded = skill_loader.load_skill("cached")
+        assert reloaded is not first
+        assert reloaded.title == "After"
+
     def test_get_all_audio_skills(self, skill_loader: ImageSkillLoader) -> None:
         """Test getting all skills"""
         skills = skill_loader.get_all_skills()
@@ -876,17 +855,10 @@ class TestImageModuleFunctions:
     """Test suite for module-level convenience functions"""
 
     @pytest.fixture
-    def temp_skills_dir(self, tmp_path: Path, monkeypatch) -> Path:
-        """Create temporary skills directory"""
-        skills_dir = tmp_path / "skills"
-        skills_dir.mkdir()
-
-        skill_dir = skills_dir / "test_skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("# Test\n\nTest skill")
-
-        monkeypatch.setattr(image_skills_module, "IMAGE_SKILLS_DIR", skills_dir)
-        return skills_dir
+    def temp_skills_dir(self, shared_skills_dir: Path, monkeypatch) -> Path:
+        """Point the module's skills directory at the shared one"""
+        monkeypatch.setattr(image_skills_module, "IMAGE_SKILLS_DIR", shared_skills_dir)
+        return shared_skills_dir
 
     def test_load_image_skill_function(self, temp_skills_dir: Path) -> None:
         """Test module-level load_skill function"""
@@ -958,16 +930,18 @@ class TestImageSkillsIntegration:
 class TestImageEdgeCases:
     """Test edge cases and error conditions"""
 
-    def test_skill_with_empty_content(self, tmp_path: Path) -> None:
-        """Test skill with empty SKILL.md"""
-        skill_dir = tmp_path / "empty_skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("")
+    @pytest.mark.parametrize("name,title,description", _EDGE_CASES)
+    def test_minimal_skill(
+        self, edge_skills_dir: Path, name: str, title: str, description: str
+    ) -> None:
+        """Test empty, dashed-name, unicode and section-less skills"""
+        skill = ImageSkill(name, edge_skills_dir / name)
 
-        skill = ImageSkill("empty_skill", skill_dir)
-        assert skill.content == ""
-        assert skill.title == "empty_skill"
-        assert skill.description == ""
+        assert skill.name == name
+        assert skill.content == _EDGE_LAYOUT[name]
+        assert skill.title == title
+        assert skill.description == description
+        assert skill.get_all_sections() == {}
 
     def test_skill_with_only_code_blocks(self, tmp_path: Path) -> None:
         """Test skill with only code blocks"""
@@ -1079,35 +1053,3 @@ Different content here.
         assert "Install the package" in install
         assert "pip install" in install or "```bash" in install
         assert "That's all" in install
-
-    def test_get_all_sections_empty_skill(self, tmp_path: Path) -> None:
-        """Test getting all sections from skill without sections"""
-        skill_dir = tmp_path / "no_sections_skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("# Title\n\nJust content, no sections")
-
-        skill = ImageSkill("no_sections_skill", skill_dir)
-        sections = skill.get_all_sections()
-        assert isinstance(sections, dict)
-        assert len(sections) == 0
-
-    def test_special_characters_in_skill_name(self, tmp_path: Path) -> None:
-        """Test skill with special characters in directory name"""
-        skill_dir = tmp_path / "skill-with-dashes"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("# Skill With Dashes\n\nContent")
-
-        skill = ImageSkill("skill-with-dashes", skill_dir)
-        assert skill.name == "skill-with-dashes"
-        assert skill.title == "Skill With Dashes"
-
-    def test_unicode_in_skill_content(self, tmp_path: Path) -> None:
-        """Test skill with unicode characters"""
-        skill_dir = tmp_path / "unicode_skill"
-        skill_dir.mkdir()
-        (skill_dir / "SKILL.md").write_text("# 技能\n\n日本語コンテンツ 🎵")
-
-        skill = ImageSkill("unicode_skill", skill_dir)
-        assert "技能" in skill.title
-        assert "日本語" in skill.content
-        assert "🎵" in skill.content